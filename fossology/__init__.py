@@ -13,8 +13,9 @@ from fossology.folders import Folders
 from fossology.groups import Groups
 from fossology.items import Items
 from fossology.jobs import Jobs
+from fossology.jsonutils import decode_json
 from fossology.license import LicenseEndpoint
-from fossology.obj import Agents, ApiInfo, HealthInfo, User
+from fossology.obj import ApiInfo, HealthInfo, User
 from fossology.report import Report
 from fossology.search import Search
 from fossology.uploads import Uploads
@@ -68,14 +69,14 @@ def fossology_token(
             "username": username,
             "password": password,
             "tokenName": token_name,
-            "tokenScope": token_scope.value,
+            "tokenScope": token_scope,
         }
     else:
         data = {
             "username": username,
             "password": password,
             "token_name": token_name,
-            "token_scope": token_scope.value,
+            "token_scope": token_scope,
         }
     if token_expire:
         if version == "v2":
@@ -91,7 +92,7 @@ def fossology_token(
     try:
         response = requests.post(url + "/api/" + version + "/tokens", data=data)
         if response.status_code == 201:
-            token = response.json()["Authorization"]
+            token = decode_json(response.content)["Authorization"]
             return token.replace("Bearer ", "")
         elif response.status_code == 404:
             description = "Authentication error"
@@ -156,13 +157,7 @@ class Fossology(
         """
         response = self.session.get(f"{self.api}/users/self")
         if response.status_code == 200:
-            user_agents = None
-            user_details = response.json()
-            if user_details.get("agents"):
-                user_agents = Agents.from_json(user_details["agents"])
-            user = User.from_json(user_details)
-            user.agents = user_agents
-            return user
+            return User.from_json(decode_json(response.content))
         else:
             description = "Error while getting details about authenticated user"
             raise FossologyApiError(description, response)
@@ -181,7 +176,7 @@ class Fossology(
         """
         response = self.session.get(f"{self.api}/info")
         if response.status_code == 200:
-            return ApiInfo.from_json(response.json())
+            return ApiInfo.from_json(decode_json(response.content))
         else:
             description = "Error while getting API info"
             raise FossologyApiError(description, response)
@@ -197,7 +192,7 @@ class Fossology(
         """
         response = self.session.get(f"{self.api}/health")
         if response.status_code == 200:
-            return HealthInfo.from_json(response.json())
+            return HealthInfo.from_json(decode_json(response.content))
         else:
             description = "Error while getting health info"
             raise FossologyApiError(description, response)
@@ -1,10 +1,32 @@
 # Copyright 2023 Siemens AG
 # SPDX-License-Identifier: MIT
 
-from enum import Enum
+from enum import Enum, EnumMeta
 
 
-class AccessLevel(Enum):
+class _FastEnumMeta(EnumMeta):
+    """Look up members by value without going through ``Enum.__new__``"""
+
+    def __call__(cls, value, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
+        return super().__call__(value, *args, **kwargs)
+
+
+class _StrEnum(str, Enum, metaclass=_FastEnumMeta):
+    """Enum whose members are used as their value in strings, like 3.11's StrEnum"""
+
+    def __str__(self) -> str:
+        return str.__str__(self)
+
+    def __format__(self, format_spec: str) -> str:
+        return str.__format__(self, format_spec)
+
+
+class AccessLevel(_StrEnum):
     """Available access levels for uploads:
 
     PRIVATE
@@ -18,7 +40,7 @@ class AccessLevel(Enum):
     PUBLIC = "public"
 
 
-class ReportFormat(Enum):
+class ReportFormat(_StrEnum):
     """Available report format:
 
     DEP5
@@ -36,7 +58,7 @@ class ReportFormat(Enum):
     UNIFIEDREPORT = "unifiedreport"
 
 
-class SearchTypes(Enum):
+class SearchTypes(_StrEnum):
     """Type of item that can be searched:
 
     ALLFILES
@@ -50,7 +72,7 @@ class SearchTypes(Enum):
     DIRECTORY = "directory"
 
 
-class TokenScope(Enum):
+class TokenScope(_StrEnum):
     """Scope for API tokens:
 
     READ: Read only access, limited only to "GET" calls
@@ -63,7 +85,7 @@ class TokenScope(Enum):
     WRITE = "write"
 
 
-class ClearingStatus(Enum):
+class ClearingStatus(_StrEnum):
     """Clearing statuses:
 
     OPEN
@@ -79,7 +101,7 @@ class ClearingStatus(Enum):
     REJECTED = "Rejected"
 
 
-class JobStatus(Enum):
+class JobStatus(_StrEnum):
     """Job statuses:
 
     COMPLETED
@@ -95,7 +117,7 @@ class JobStatus(Enum):
     PROCESSING = "Processing"
 
 
-class LicenseType(Enum):
+class LicenseType(_StrEnum):
     """License types:
 
     CANDIDATE
@@ -109,7 +131,7 @@ class LicenseType(Enum):
     ALL = "all"
 
 
-class ObligationClass(Enum):
+class ObligationClass(_StrEnum):
     """Classification of an obligation:
 
     GREEN
@@ -125,7 +147,7 @@ class ObligationClass(Enum):
     RED = "red"
 
 
-class MemberPerm(Enum):
+class MemberPerm(int, Enum, metaclass=_FastEnumMeta):
     """Group member permissions:
 
     USER
@@ -138,8 +160,14 @@ class MemberPerm(Enum):
     ADMIN = 1
     ADVISOR = 2
 
+    def __str__(self) -> str:
+        return int.__repr__(self)
+
+    def __format__(self, format_spec: str) -> str:
+        return int.__format__(self, format_spec)
+
 
-class Permission(Enum):
+class Permission(_StrEnum):
     """Upload or group permissions:
 
     NONE
@@ -156,7 +184,7 @@ class Permission(Enum):
     ADMIN = "10"
 
 
-class ClearingScope(Enum):
+class ClearingScope(_StrEnum):
     """Scope of the clearing:
 
     LOCAL
@@ -169,7 +197,7 @@ class ClearingScope(Enum):
     GLOBAL = "global"
 
 
-class ClearingType(Enum):
+class ClearingType(_StrEnum):
     """Type of the clearing:
 
     TO_BE_DISCUSSED
@@ -186,7 +214,7 @@ class ClearingType(Enum):
     NON_FUNCTIONAL = "NON_FUNCTIONAL"
 
 
-class PrevNextSelection(Enum):
+class PrevNextSelection(_StrEnum):
     """Type of file to be selected for the prev-next endpoint:
 
     WITHLICENSES
@@ -197,7 +225,7 @@ class PrevNextSelection(Enum):
     NOCLEARING = "noClearing"
 
 
-class CopyrightStatus(Enum):
+class CopyrightStatus(_StrEnum):
     """Status of the copyrights:
 
     ACTIVE
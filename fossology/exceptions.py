@@ -3,6 +3,8 @@
 
 from json.decoder import JSONDecodeError
 
+from fossology.jsonutils import decode_json
+
 
 class Error(Exception):
     """Base class for exceptions in this module."""
@@ -16,7 +18,7 @@ class AuthenticationError(Error):
     def __init__(self, description, response=None):
         if response:
             try:
-                message = response.json().get("message")
+                message = decode_json(response.content).get("message")
             except JSONDecodeError:
                 message = response.text
             self.message = f"{description}: {message} ({response.status_code})"
@@ -30,7 +32,7 @@ class AuthorizationError(Error):
 
     def __init__(self, description, response):
         try:
-            message = response.json().get("message")
+            message = decode_json(response.content).get("message")
         except JSONDecodeError:
             message = response.text
         self.message = f"{description}: {message} ({response.status_code})"
@@ -42,13 +44,33 @@ class FossologyApiError(Error):
 
     def __init__(self, description, response=None):
         try:
-            message = response.json().get("message")
+            message = decode_json(response.content).get("message")
         except JSONDecodeError:
             message = response.text
         self.message = f"{description}: {message} ({response.status_code})"
         super().__init__(self.message)
 
 
+class FossologyBulkError(FossologyApiError):
+    """Some requests of an operation on several uploads failed
+
+    The requests for the other uploads were performed.
+
+    :param description: what the operation was about
+    :param failures: the uploads whose request failed and the error raised for each
+    :type description: string
+    :type failures: list of (Upload, Exception) tuples
+    """
+
+    def __init__(self, description, failures):
+        self.failures = failures
+        details = "; ".join(
+            f"upload {upload.id}: {error}" for upload, error in failures
+        )
+        self.message = f"{description}: {details}"
+        Error.__init__(self, self.message)
+
+
 class FossologyUnsupported(Error):
     """Endpoint or option not supported"""
 
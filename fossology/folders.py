@@ -5,6 +5,7 @@
 import logging
 
 from fossology.exceptions import AuthorizationError, FossologyApiError
+from fossology.jsonutils import decode_json
 from fossology.obj import Folder
 
 logger = logging.getLogger(__name__)
@@ -25,12 +26,7 @@ class Folders:
         """
         response = self.session.get(f"{self.api}/folders")
         if response.status_code == 200:
-            folders_list = list()
-            response_list = response.json()
-            for folder in response_list:
-                sub_folder = Folder.from_json(folder)
-                folders_list.append(sub_folder)
-            return folders_list
+            return Folder.from_json_list(decode_json(response.content))
         else:
             description = f"Unable to get a list of folders for {self.user.name}"
             raise FossologyApiError(description, response)
@@ -48,7 +44,7 @@ class Folders:
         """
         response = self.session.get(f"{self.api}/folders/{folder_id}")
         if response.status_code == 200:
-            detailed_folder = Folder.from_json(response.json())
+            detailed_folder = Folder.from_json(decode_json(response.content))
             for folder in self.folders:
                 if folder.id == folder_id:
                     self.folders.remove(folder)
@@ -113,7 +109,7 @@ class Folders:
 
         elif response.status_code == 201:
             logger.info(f"Folder {name} has been created")
-            return self.detail_folder(response.json()["message"])
+            return self.detail_folder(decode_json(response.content)["message"])
 
         elif response.status_code == 403:
             description = f"Folder creation in folder {parent.id} not authorized"
@@ -112,11 +112,11 @@ def check_get_report_format(format: str):
     :return: ReportFormat
     :rtype: Enum
     """
-    for member in ReportFormat:
-        if member.value == format:
-            return member
-    logger.fatal(f"Impossible report format {format}")
-    sys.exit(1)
+    try:
+        return ReportFormat(format)
+    except ValueError:
+        logger.fatal(f"Impossible report format {format}")
+        sys.exit(1)
 
 
 def check_get_access_level(level: str):
@@ -127,11 +127,11 @@ def check_get_access_level(level: str):
     :return: AccessLevel
     :rtype: Enum
     """
-    for member in AccessLevel:
-        if member.value == level:
-            return member
-    logger.fatal(f"Impossible access level {level}")
-    sys.exit(1)
+    try:
+        return AccessLevel(level)
+    except ValueError:
+        logger.fatal(f"Impossible access level {level}")
+        sys.exit(1)
 
 
 def needs_later_initialization_of_foss_instance(ctx: click.Context):
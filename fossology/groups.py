@@ -6,6 +6,7 @@ import logging
 
 from fossology.enums import MemberPerm
 from fossology.exceptions import FossologyApiError
+from fossology.jsonutils import decode_json
 from fossology.obj import Group, UserGroupMember
 
 logger = logging.getLogger(__name__)
@@ -32,12 +33,7 @@ class Groups:
         endpoint += "/deletable" if deletable else ""
         response = self.session.get(endpoint)
         if response.status_code == 200:
-            groups_list = []
-            response_list = response.json()
-            for group in response_list:
-                single_group = Group.from_json(group)
-                groups_list.append(single_group)
-            return groups_list
+            return Group.from_json_list(decode_json(response.content))
         else:
             description = f"Unable to get a list of {'deletable ' if deletable else ''}groups for {self.user.name}"
             raise FossologyApiError(description, response)
@@ -53,12 +49,7 @@ class Groups:
         """
         response = self.session.get(f"{self.api}/groups/{group_id}/members")
         if response.status_code == 200:
-            members_list = []
-            response_list = response.json()
-            for member in response_list:
-                single_member = UserGroupMember.from_json(member)
-                members_list.append(single_member)
-            return members_list
+            return UserGroupMember.from_json_list(decode_json(response.content))
         else:
             description = f"Unable to get a list of members for group {group_id}"
             raise FossologyApiError(description, response)
@@ -6,6 +6,7 @@ import logging
 
 from fossology.enums import CopyrightStatus, PrevNextSelection
 from fossology.exceptions import FossologyApiError
+from fossology.jsonutils import decode_json
 from fossology.obj import (
     FileInfo,
     GetBulkHistory,
@@ -43,7 +44,7 @@ class Items:
         )
 
         if response.status_code == 200:
-            return FileInfo.from_json(response.json())
+            return FileInfo.from_json(decode_json(response.content))
 
         elif response.status_code == 404:
             description = f"Upload {upload.id} or item {item_id} not found"
@@ -72,11 +73,11 @@ class Items:
         :raises FossologyApiError: if the REST call failed
         """
         response = self.session.get(
-            f"{self.api}/uploads/{upload.id}/item/{item_id}/totalcopyrights?status={status.value}"
+            f"{self.api}/uploads/{upload.id}/item/{item_id}/totalcopyrights?status={status}"
         )
 
         if response.status_code == 200:
-            return response.json()["total_copyrights"]
+            return decode_json(response.content)["total_copyrights"]
 
         elif response.status_code == 404:
             description = f"Upload {upload.id} or item {item_id} not found"
@@ -108,10 +109,7 @@ class Items:
         )
 
         if response.status_code == 200:
-            clearing_history = []
-            for action in response.json():
-                clearing_history.append(GetClearingHistory.from_json(action))
-            return clearing_history
+            return GetClearingHistory.from_json_list(decode_json(response.content))
 
         elif response.status_code == 404:
             description = f"Upload {upload.id} or item {item_id} not found"
@@ -147,7 +145,7 @@ class Items:
         )
 
         if response.status_code == 200:
-            return GetPrevNextItem.from_json(response.json())
+            return GetPrevNextItem.from_json(decode_json(response.content))
 
         elif response.status_code == 404:
             description = f"Upload {upload.id} or item {item_id} not found"
@@ -179,10 +177,7 @@ class Items:
         )
 
         if response.status_code == 200:
-            bulk_history = []
-            for item in response.json():
-                bulk_history.append(GetBulkHistory.from_json(item))
-            return bulk_history
+            return GetBulkHistory.from_json_list(decode_json(response.content))
 
         elif response.status_code == 404:
             description = f"Upload {upload.id} or item {item_id} not found"
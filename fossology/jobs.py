@@ -8,6 +8,7 @@ import time
 from typing import Optional
 
 from fossology.exceptions import AuthorizationError, FossologyApiError
+from fossology.jsonutils import decode_json
 from fossology.obj import Folder, Job, Upload
 
 logger = logging.getLogger(__name__)
@@ -63,8 +64,7 @@ class Jobs:
             headers["page"] = str(page)
             response = self.session.get(jobs_endpoint, params=params, headers=headers)
             if response.status_code == 200:
-                for job in response.json():
-                    jobs_list.append(Job.from_json(job))
+                jobs_list.extend(Job.from_json_list(decode_json(response.content)))
                 x_total_pages = int(response.headers.get("X-TOTAL-PAGES", 0))
                 if not all_pages or x_total_pages == 0:
                     logger.info(
@@ -99,7 +99,7 @@ class Jobs:
         response = self.session.get(f"{self.api}/jobs/{job_id}")
         if wait:
             if response.status_code == 200:
-                job = Job.from_json(response.json())
+                job = Job.from_json(decode_json(response.content))
                 if job.status == "Completed":
                     logger.debug(f"Job {job_id} has completed")
                     return job
@@ -112,7 +112,7 @@ class Jobs:
 
         if response.status_code == 200:
             logger.debug(f"Got details for job {job_id}")
-            return Job.from_json(response.json())
+            return Job.from_json(decode_json(response.content))
         else:
             description = f"Error while getting details for job {job_id}"
             raise FossologyApiError(description, response)
@@ -193,7 +193,7 @@ class Jobs:
 
         if response.status_code == 201:
             detailled_job = self.detail_job(
-                response.json()["message"], wait=wait, timeout=timeout
+                decode_json(response.content)["message"], wait=wait, timeout=timeout
             )
             return detailled_job
 
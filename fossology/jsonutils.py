@@ -0,0 +1,23 @@
+# Copyright 2026 Siemens AG
+# SPDX-License-Identifier: MIT
+
+"""JSON encoding and decoding shared by the objects and the endpoint classes
+
+orjson is used when it is installed, the standard library otherwise.
+"""
+
+import json
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # Same output as orjson; json.dumps() only reuses its encoder for the
+    # default options
+    encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+    decode_json = json.loads
+else:
+
+    def encode_json(obj):
+        return orjson.dumps(obj).decode()
+
+    decode_json = orjson.loads  # type: ignore[assignment]
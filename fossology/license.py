@@ -10,6 +10,7 @@ from urllib.parse import quote
 
 from fossology.enums import LicenseType
 from fossology.exceptions import FossologyApiError
+from fossology.jsonutils import decode_json
 from fossology.obj import License, Obligation
 
 logger = logging.getLogger(__name__)
@@ -18,7 +19,7 @@ logger.setLevel(logging.DEBUG)
 
 def check_empty_response(response) -> bool:
     try:
-        message = response.json().get("message")
+        message = decode_json(response.content).get("message")
         if message and message == "Can not exceed total pages: 0":
             return True
     except JSONDecodeError:
@@ -68,11 +69,12 @@ class LicenseEndpoint:
         while page <= x_total_pages:
             headers["page"] = str(page)
             response = self.session.get(
-                f"{self.api}/license?kind={kind.value}", headers=headers
+                f"{self.api}/license?kind={kind}", headers=headers
             )
             if response.status_code == 200:
-                for license in response.json():
-                    license_list.append(License.from_json(license))
+                license_list.extend(
+                    License.from_json_list(decode_json(response.content))
+                )
                 x_total_pages = int(response.headers.get("X-TOTAL-PAGES", 0))
                 if not all_pages or x_total_pages == 0:
                     logger.info(
@@ -112,7 +114,7 @@ class LicenseEndpoint:
             f"{self.api}/license/{quote(shortname)}", headers=headers
         )
         if response.status_code == 200:
-            return License.from_json(response.json())
+            return License.from_json(decode_json(response.content))
         elif response.status_code == 404:
             description = f"License {shortname} not found"
             raise FossologyApiError(description, response)
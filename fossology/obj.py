@@ -2,13 +2,254 @@
 # Copyright 2019 Siemens AG
 # SPDX-License-Identifier: MIT
 
-import json
+"""Plain data holders for the responses of the FOSSology REST API
+
+The API is the only source of these objects and its responses are trusted, so
+``from_json`` does no runtime validation and the classes do not build on a
+validation library such as pydantic. Any checking of user input belongs to the
+public methods of the endpoint classes, not to the loading path.
+"""
+
+import inspect
+from array import array
+from datetime import datetime
+from enum import EnumMeta
 from typing import Iterable
 
-from fossology.enums import ClearingScope, ClearingType, Permission
+from fossology.enums import (
+    AccessLevel,
+    ClearingScope,
+    ClearingStatus,
+    ClearingType,
+    JobStatus,
+    ObligationClass,
+    Permission,
+)
+from fossology.jsonutils import encode_json
+
+
+class _EmptyDict(dict):
+    """Empty ``dict`` which cannot be changed, see ``_EMPTY``"""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__!r} object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __reduce__(self):
+        # Copies and unpickled objects keep using the shared instance
+        return "_EMPTY"
+
+
+# Shared by all instances created without additional fields
+_EMPTY: dict = _EmptyDict()
+
+# Status strings repeated in every record are stored as a single object each
+_KNOWN_VALUES: dict = {
+    value: value
+    for enum in (AccessLevel, ClearingStatus, JobStatus, ObligationClass)
+    for value in enum._value2member_map_
+}
+
+
+def _intern_value(value):
+    return _KNOWN_VALUES.get(value, value)
+
+
+def _parse_timestamp(value):
+    """Parse a timestamp of the API, e.g. ``2023-08-17 08:39:04.384337+00``"""
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Before Python 3.11 fromisoformat() rejects the "+00" offsets of the API
+        if value[-3:-2] in ("+", "-"):
+            value += "00"
+        fmt = "%Y-%m-%d %H:%M:%S.%f%z" if "." in value else "%Y-%m-%d %H:%M:%S%z"
+        return datetime.strptime(value, fmt)
+
+
+def _generate_from_json(cls):
+    """Attach a ``from_json`` classmethod generated for the fields of ``cls``
+
+    The generated code creates the instance without calling ``__init__`` and
+    assigns each of its arguments straight from the JSON dict, passing the values
+    through ``cls._json_converters`` where ``__init__`` converts them and storing
+    them under ``cls._json_attributes`` where ``__init__`` renames them. Arguments
+    listed in ``cls._json_keys`` are read from a differently named key. Keys which
+    are not arguments of ``__init__`` are stored in ``additional_info`` (or the
+    attribute named by ``cls._json_extra``, ``None`` to drop them). Enum converters
+    look the value up in the member map directly. Payloads with a missing required
+    key or an unknown enum value, or with one of the keys in ``cls._json_init_keys``,
+    go through ``cls(**json_dict)`` with the keys of ``cls._json_keys`` renamed back
+    to the arguments, which raises the usual ``TypeError`` or ``ValueError``.
+    """
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    fields = [p for p in parameters if p.kind is p.POSITIONAL_OR_KEYWORD]
+    converters = getattr(cls, "_json_converters", {})
+    attributes = getattr(cls, "_json_attributes", {})
+    keys = {field.name: field.name for field in fields}
+    keys.update(getattr(cls, "_json_keys", {}))
+    extra = getattr(cls, "_json_extra", "additional_info")
+    renamed = {key: name for name, key in keys.items() if key != name}
+    namespace = {
+        "_EMPTY": _EMPTY,
+        "_known": frozenset(keys.values()),
+        "_new": object.__new__,
+        "_renamed": renamed,
+        "_init_keys": frozenset(getattr(cls, "_json_init_keys", ())),
+    }
+    if renamed:
+        fallback = "cls(**{_renamed.get(k, k): v for k, v in json_dict.items()})"
+    else:
+        fallback = "cls(**json_dict)"
+    has_kwargs = any(p.kind is p.VAR_KEYWORD for p in parameters)
+    lines = ["def from_json(cls, json_dict):"]
+    if namespace["_init_keys"]:
+        lines += [
+            "    if not _init_keys.isdisjoint(json_dict):",
+            f"        return {fallback}",
+        ]
+    if has_kwargs:
+        lines += [
+            "    if _known.issuperset(json_dict):",
+            "        extra = _EMPTY",
+            "    else:",
+            "        extra = {k: v for k, v in json_dict.items() if k not in _known}",
+        ]
+    else:
+        lines += [
+            "    if not _known.issuperset(json_dict):",
+            f"        return {fallback}",
+        ]
+    lines += ["    self = _new(cls)", "    try:"]
+    for field in fields:
+        if field.default is field.empty:
+            value = f"json_dict[{keys[field.name]!r}]"
+        else:
+            namespace[f"_default_{field.name}"] = field.default
+            value = f"json_dict.get({keys[field.name]!r}, _default_{field.name})"
+        if field.name in converters:
+            converter = namespace[f"_convert_{field.name}"] = converters[field.name]
+            if isinstance(converter, EnumMeta):
+                namespace[f"_lookup_{field.name}"] = converter._value2member_map_
+                value = f"_lookup_{field.name}[{value}]"
+            else:
+                value = f"_convert_{field.name}({value})"
+        attribute = attributes.get(field.name, field.name)
+        lines.append(f"        self.{attribute} = {value}")
+    lines += ["    except (KeyError, TypeError):", f"        return {fallback}"]
+    if has_kwargs and extra:
+        lines.append(f"    self.{extra} = extra")
+    lines.append("    return self")
+    exec("\n".join(lines), namespace)
+    cls.from_json = classmethod(namespace["from_json"])
+
+
+class _JsonModel:
+    """Base class of the objects built from the JSON responses of the REST API
+
+    Subclasses get a ``from_json`` classmethod generated for their fields,
+    unless they define their own, and
+    ``__match_args__`` listing the attributes set from the arguments of
+    ``__init__``. ``repr()`` shows the ``id`` or, without one, the attribute named
+    by ``_repr_field`` (default: the first of ``__match_args__``). Unknown
+    fields of the response can be read as attributes too.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "from_json" not in cls.__dict__:
+            _generate_from_json(cls)
+        if "__match_args__" not in cls.__dict__:
+            attributes = getattr(cls, "_json_attributes", {})
+            match_args = tuple(
+                name
+                if isinstance(cls.__dict__.get(name), _LazyJson)
+                else attributes.get(name, name)
+                for name, parameter in inspect.signature(
+                    cls.__init__
+                ).parameters.items()
+                if parameter.kind is parameter.POSITIONAL_OR_KEYWORD and name != "self"
+            )
+            setattr(cls, "__match_args__", match_args)
+        if "_repr_field" not in cls.__dict__:
+            match_args = cls.__match_args__
+            cls._repr_field = "id" if "id" in match_args else match_args[0]
+
+    @classmethod
+    def from_json(cls, json_dict):
+        return cls(**json_dict)
+
+    @classmethod
+    def from_json_list(cls, json_list):
+        """Create one object per JSON dict of a list response
+
+        :param json_list: the records returned by the API
+        :type json_list: list of dict
+        :return: the objects in the order of the records
+        :rtype: list
+        """
+        return list(map(cls.from_json, json_list))
+
+    def __repr__(self):
+        field = self._repr_field
+        if field is None:
+            return f"{type(self).__name__}()"
+        return f"{type(self).__name__}({field}={getattr(self, field)!r})"
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set, e.g. fields the server
+        # added in a newer version and that are kept in additional_info
+        if hasattr(type(self), name):
+            # An unset slot or a property which raised AttributeError, raise the
+            # original error again instead of hiding it
+            return object.__getattribute__(self, name)
+        extra = getattr(type(self), "_json_extra", "additional_info")
+        if extra and not name.startswith("_"):
+            try:
+                return getattr(self, extra)[name]
+            except (AttributeError, KeyError):
+                pass
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+
+class _LazyJson:
+    """Attribute holding the JSON dict of a nested object until it is first read
+
+    The dict is converted with ``convert`` on first access and the result replaces
+    it in the ``_<name>_raw`` slot of the instance. Other values are returned as
+    they are.
+    """
+
+    def __init__(self, convert):
+        self.convert = convert
 
+    def __set_name__(self, owner, name):
+        self.slot = f"_{name}_raw"
 
-class Agents(object):
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if isinstance(value, dict):
+            value = self.convert(value)
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+
+class Agents(_JsonModel):
     """FOSSology agents.
 
     Represents the agents currently configured for a given user.
@@ -35,6 +276,22 @@ class Agents(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "bucket",
+        "copyright_email_author",
+        "ecc",
+        "keyword",
+        "mimetype",
+        "monk",
+        "nomos",
+        "ojo",
+        "package",
+        "additional_agents",
+    )
+
+    _repr_field = None
+    _json_extra = "additional_agents"
+
     def __init__(
         self,
         bucket,
@@ -57,7 +314,7 @@ class Agents(object):
         self.nomos = nomos
         self.ojo = ojo
         self.package = package
-        self.additional_agents = kwargs
+        self.additional_agents = kwargs or _EMPTY
 
     def to_dict(self):
         """Get a directory with the agent configuration
@@ -65,7 +322,7 @@ class Agents(object):
         :return: the agents configured for the current user
         :rtype: dict
         """
-        generic_agents = {
+        agents = {
             "bucket": self.bucket,
             "copyright_email_author": self.copyright_email_author,
             "ecc": self.ecc,
@@ -76,27 +333,20 @@ class Agents(object):
             "ojo": self.ojo,
             "package": self.package,
         }
-        try:
-            agents = {**generic_agents, **self.additional_agents}
-        except AttributeError:
-            agents = generic_agents
-
+        if self.additional_agents:
+            agents.update(self.additional_agents)
         return agents
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
     def to_json(self):
         """Get a JSON object with the agent configuration
 
         :return: the agents configured for the current user
         :rtype: JSON
         """
-        return json.dumps(self.to_dict())
+        return encode_json(self.to_dict())
 
 
-class User(object):
+class User(_JsonModel):
     """FOSSology user.
 
     Represents the user currently authenticated against the FOSSology server.
@@ -121,6 +371,24 @@ class User(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "email",
+        "accessLevel",
+        "rootFolderId",
+        "emailNotification",
+        "default_group",
+        "_agents_raw",
+        "additional_info",
+    )
+
+    _json_converters = {"accessLevel": _intern_value}
+    _json_attributes = {"agents": "_agents_raw"}
+
+    agents = _LazyJson(lambda agents: Agents.from_json(agents) if agents else None)
+
     def __init__(
         self,
         id: int,
@@ -138,12 +406,12 @@ class User(object):
         self.name = name
         self.description = description
         self.email = email
-        self.accessLevel = accessLevel
+        self.accessLevel = _intern_value(accessLevel)
         self.rootFolderId = rootFolderId
         self.emailNotification = emailNotification
         self.default_group = default_group
         self.agents = agents
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return (
@@ -153,12 +421,8 @@ class User(object):
             f"default group {self.default_group}"
         )
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class UserGroupMember(object):
+class UserGroupMember(_JsonModel):
     """FOSSology group member.
 
     Represents a member of a group.
@@ -171,25 +435,27 @@ class UserGroupMember(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("_user_raw", "group_perm", "additional_info")
+
+    _json_attributes = {"user": "_user_raw"}
+
+    user = _LazyJson(User.from_json)
+
     def __init__(
         self,
         user: User,
         group_perm: int,
         **kwargs: dict,
     ):
-        self.user = User.from_json(user)
+        self.user = user
         self.group_perm = group_perm
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"Member {self.user.name} ({self.user.id}) has permission {self.group_perm}."
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class Folder(object):
+class Folder(_JsonModel):
     """FOSSology folder.
 
     Represents a FOSSology folder.
@@ -206,12 +472,14 @@ class Folder(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("id", "name", "description", "parent", "additional_info")
+
     def __init__(self, id, name, description, parent, **kwargs):
         self.id = id
         self.name = name
         self.description = description
         self.parent = parent
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return (
@@ -219,12 +487,8 @@ class Folder(object):
             f"parent folder id = {self.parent}"
         )
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class Findings(object):
+class Findings(_JsonModel):
     """FOSSology license findings.
 
     Represents FOSSology license findings.
@@ -239,6 +503,10 @@ class Findings(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("scanner", "conclusion", "copyright", "additional_info")
+
+    _repr_field = None
+
     def __init__(
         self,
         scanner: list,
@@ -249,20 +517,17 @@ class Findings(object):
         self.scanner = scanner
         self.conclusion = conclusion
         self.copyright = copyright
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
+        copyrights = len(self.copyright) if self.copyright else 0
         return (
             f"Licenses found by scanners: {self.scanner}, concluded licenses: {self.conclusion}, "
-            f"{len(self.copyright)} copyrights"
+            f"{copyrights} copyrights"
         )
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
 
-
-class Group(object):
+class Group(_JsonModel):
     """FOSSology group.
 
     Represents a FOSSology group.
@@ -275,20 +540,18 @@ class Group(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("id", "name", "additional_info")
+
     def __init__(self, id, name, **kwargs):
         self.id = id
         self.name = name
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"Group {self.name} ({self.id})"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class PermGroups(object):
+class PermGroups(_JsonModel):
     """GroupIds with their respective permissions for a upload
 
     Represents the group permissions for a FOSSology upload.
@@ -301,6 +564,11 @@ class PermGroups(object):
     :type group_name: str
     """
 
+    __slots__ = ("perm", "group_pk", "group_name")
+
+    _repr_field = "group_pk"
+    _json_converters = {"perm": Permission}
+
     def __init__(self, perm: str, group_pk: str, group_name: str):
         self.perm = Permission(perm)
         self.group_pk = group_pk
@@ -309,12 +577,8 @@ class PermGroups(object):
     def __str__(self):
         return f"Group {self.group_name} ({self.group_pk}) with {self.perm.name} permission"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class UploadPermGroups(object):
+class UploadPermGroups(_JsonModel):
     """Upload permissions
 
     Represents the permissions for a FOSSology upload.
@@ -327,22 +591,23 @@ class UploadPermGroups(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("publicPerm", "permGroups", "additional_info")
+
+    _json_converters = {
+        "publicPerm": Permission,
+        "permGroups": PermGroups.from_json_list,
+    }
+
     def __init__(self, publicPerm: str, permGroups: list, **kwargs):
         self.publicPerm = Permission(publicPerm)
-        self.permGroups = list()
-        for perm in permGroups:
-            self.permGroups.append(PermGroups.from_json(perm))
-        self.additional_info = kwargs
+        self.permGroups = PermGroups.from_json_list(permGroups)
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"Upload with {self.publicPerm.name} permission and permissions for groups {self.permGroups}"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class License(object):
+class License(_JsonModel):
     """FOSSology license.
 
     Represents a FOSSology license.
@@ -363,6 +628,17 @@ class License(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "id",
+        "shortName",
+        "fullName",
+        "text",
+        "url",
+        "risk",
+        "isCandidate",
+        "additional_info",
+    )
+
     def __init__(
         self, shortName, fullName, text, url, risk, isCandidate, id=None, **kwargs
     ):
@@ -373,7 +649,7 @@ class License(object):
         self.url = url
         self.risk = risk
         self.isCandidate = isCandidate
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         license_type = "License"
@@ -396,20 +672,16 @@ class License(object):
             "isCandidate": self.isCandidate,
         }
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
     def to_json(self) -> str:
         """Get a JSON object with the license data
 
         :return: the license data
         :rtype: JSON
         """
-        return json.dumps(self.to_dict())
+        return encode_json(self.to_dict())
 
 
-class Obligation(object):
+class Obligation(_JsonModel):
     """FOSSology license obligation.
 
     Represents a FOSSology license obligation.
@@ -430,24 +702,32 @@ class Obligation(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "id",
+        "topic",
+        "type",
+        "text",
+        "classification",
+        "comment",
+        "additional_info",
+    )
+
+    _json_converters = {"classification": _intern_value}
+
     def __init__(self, id, topic, type, text, classification, comment, **kwargs):
         self.id = id
         self.topic = topic
         self.type = type
         self.text = text
-        self.classification = classification
+        self.classification = _intern_value(classification)
         self.comment = comment
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"Obligation {self.topic}, {self.type} ({self.id}) is classified {self.classification}"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
 
-
-class Hash(object):
+class Hash(_JsonModel):
     """FOSSology hash.
 
     Represents a FOSSology file hash values.
@@ -464,6 +744,8 @@ class Hash(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("sha1", "md5", "sha256", "size", "additional_info")
+
     def __init__(
         self,
         sha1,
@@ -476,17 +758,13 @@ class Hash(object):
         self.md5 = md5
         self.sha256 = sha256
         self.size = size
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"File SHA1: {self.sha1} MD5 {self.md5} SH256 {self.sha256} Size {self.size}B"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class File(object):
+class File(_JsonModel):
     """FOSSology file response from filesearch.
 
     Represents a FOSSology filesearch response.
@@ -499,15 +777,22 @@ class File(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("_hash_raw", "_findings_raw", "additional_info")
+
+    _json_attributes = {"hash": "_hash_raw", "findings": "_findings_raw"}
+
+    hash = _LazyJson(Hash.from_json)
+    findings = _LazyJson(Findings.from_json)
+
     def __init__(
         self,
         hash,
         findings,
         **kwargs,
     ):
-        self.hash = Hash.from_json(hash)
-        self.findings = Findings.from_json(findings)
-        self.additional_info = kwargs
+        self.hash = hash
+        self.findings = findings
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         if self.findings.conclusion:
@@ -515,12 +800,8 @@ class File(object):
         else:
             return f"File with SHA1 {self.hash.sha1} doesn't have any concluded license yet"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class FileInfo(object):
+class FileInfo(_JsonModel):
     """FOSSology file info response.
 
     Represents a FOSSology file info response.
@@ -539,6 +820,24 @@ class FileInfo(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "view_info",
+        "meta_info",
+        "package_info",
+        "tag_info",
+        "reuse_info",
+        "additional_info",
+    )
+
+    _repr_field = None
+    _json_keys = {
+        "view_info": "viewInfo",
+        "meta_info": "metaInfo",
+        "package_info": "packageInfo",
+        "tag_info": "tagInfo",
+        "reuse_info": "reuseInfo",
+    }
+
     def __init__(
         self,
         view_info,
@@ -553,24 +852,13 @@ class FileInfo(object):
         self.package_info = package_info
         self.tag_info = tag_info
         self.reuse_info = reuse_info
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"File view {self.view_info}"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        for key in ("viewInfo", "metaInfo", "packageInfo", "tagInfo", "reuseInfo"):
-            try:
-                json_dict[key.replace("I", "_i")] = json_dict[key]
-                del json_dict[key]
-            except KeyError:
-                pass
 
-        return cls(**json_dict)
-
-
-class Upload(object):
+class Upload(_JsonModel):
     """FOSSology upload.
 
     Represents a FOSSology upload.
@@ -599,6 +887,34 @@ class Upload(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "folderid",
+        "foldername",
+        "id",
+        "description",
+        "uploadname",
+        "uploaddate",
+        "assignee",
+        "assigneeDate",
+        "closeDate",
+        "_hash_raw",
+        "additional_info",
+        "_uploaddate_dt",
+    )
+
+    _json_attributes = {"closingDate": "closeDate"}
+    # Newer API versions send these keys in camelCase, payloads with filesize and
+    # filesha1 instead of a hash object go through __init__
+    _json_init_keys = ("filesize", "filesha1")
+    _json_keys = {
+        "folderid": "folderId",
+        "foldername": "folderName",
+        "uploadname": "uploadName",
+        "uploaddate": "uploadDate",
+    }
+
+    hash = _LazyJson(Hash.from_json)
+
     def __init__(
         self,
         folderid,
@@ -619,30 +935,152 @@ class Upload(object):
         self.description = description
         self.uploadname = uploadname
         self.uploaddate = uploaddate
-        self.assignee = (assignee,)
-        self.assigneeDate = (assigneeDate,)
-        self.closeDate = (closingDate,)
-        self.hash = Hash.from_json(hash)
-        self.additional_info = kwargs
+        self.assignee = assignee
+        self.assigneeDate = assigneeDate
+        self.closeDate = closingDate
+        if hash is None and "filesize" in kwargs:
+            # Older API versions send the size and SHA1 instead of a hash object
+            hash = Hash(
+                kwargs.pop("filesha1", None), None, None, kwargs.pop("filesize")
+            )
+        self.hash = hash
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return (
-            f"Upload '{self.uploadname}' ({self.id}, {self.hash.size}B, {self.hash.sha1}) "
+            f"Upload '{self.uploadname}' ({self.id}, {self.filesize}B, {self.filesha1}) "
             f"in folder {self.foldername} ({self.folderid})"
         )
 
+    @property
+    def filesize(self):
+        """Size of the uploaded file, ``None`` if the hash data is missing"""
+        return self.hash.size if self.hash else None
+
+    @property
+    def filesha1(self):
+        """SHA1 of the uploaded file, ``None`` if the hash data is missing"""
+        return self.hash.sha1 if self.hash else None
+
+    @property
+    def uploaddate_dt(self):
+        """The upload date as :class:`datetime.datetime`, parsed on first access"""
+        try:
+            return self._uploaddate_dt
+        except AttributeError:
+            self._uploaddate_dt = _parse_timestamp(self.uploaddate)
+            return self._uploaddate_dt
+
+
+def _int_column(values):
+    # Arrays only hold integers, missing values are stored as -1
+    return array("q", [-1 if value is None else value for value in values])
+
+
+class UploadBatch:
+    """Column-wise storage of an upload listing.
+
+    Keeps one list per upload field instead of one :class:`Upload` object per
+    record, with the integer fields in compact arrays. Scanning a large listing for
+    a single field then walks one contiguous column. Iterating over the batch
+    creates the :class:`Upload` objects from the records.
+
+    :param ids: the IDs of the uploads
+    :param folderids: the IDs of the upload folders, -1 if unknown
+    :param foldernames: the names of the upload folders
+    :param descriptions: further information about the uploads
+    :param uploadnames: the names of the uploads
+    :param uploaddates: the dates of the uploads
+    :param filesizes: the sizes of the uploaded files, -1 if unknown
+    :param hashes: the hash data of the uploaded files as returned by the API
+    :param records: the uploads as returned by the API
+    :type ids: array of int
+    :type folderids: array of int
+    :type foldernames: list of string
+    :type descriptions: list of string
+    :type uploadnames: list of string
+    :type uploaddates: list of string
+    :type filesizes: array of int
+    :type hashes: list of dict
+    :type records: list of dict
+    """
+
+    __slots__ = (
+        "ids",
+        "folderids",
+        "foldernames",
+        "descriptions",
+        "uploadnames",
+        "uploaddates",
+        "filesizes",
+        "hashes",
+        "records",
+    )
+
+    def __init__(
+        self,
+        ids,
+        folderids,
+        foldernames,
+        descriptions,
+        uploadnames,
+        uploaddates,
+        filesizes,
+        hashes,
+        records,
+    ):
+        self.ids = ids
+        self.folderids = folderids
+        self.foldernames = foldernames
+        self.descriptions = descriptions
+        self.uploadnames = uploadnames
+        self.uploaddates = uploaddates
+        self.filesizes = filesizes
+        self.hashes = hashes
+        self.records = records
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        """Create an :class:`Upload` for each row of the batch"""
+        return map(Upload.from_json, self.records)
+
     @classmethod
-    def from_json(cls, json_dict):
-        for key in ("folderId", "folderName", "uploadName", "uploadDate"):
-            try:
-                json_dict[key.lower()] = json_dict[key]
-                del json_dict[key]
-            except KeyError:
-                pass
-        return cls(**json_dict)
+    def from_json_list(cls, json_list):
+        """Create a batch from the records of an upload listing
+
+        :param json_list: the uploads returned by the API
+        :type json_list: list of dict
+        :return: the uploads stored column-wise
+        :rtype: UploadBatch
+        """
+        hashes = [upload.get("hash") for upload in json_list]
+        return cls(
+            _int_column(upload["id"] for upload in json_list),
+            _int_column(
+                upload.get("folderId", upload.get("folderid")) for upload in json_list
+            ),
+            [
+                upload.get("folderName", upload.get("foldername"))
+                for upload in json_list
+            ],
+            [upload["description"] for upload in json_list],
+            [
+                upload.get("uploadName", upload.get("uploadname"))
+                for upload in json_list
+            ],
+            [
+                upload.get("uploadDate", upload.get("uploaddate"))
+                for upload in json_list
+            ],
+            _int_column(hash.get("size") if hash else None for hash in hashes),
+            hashes,
+            json_list,
+        )
 
 
-class UploadCopyrights(object):
+class UploadCopyrights(_JsonModel):
     """Copyright findings in a FOSSology upload
 
     Represents copyright matches of a FOSSology upload.
@@ -655,6 +1093,10 @@ class UploadCopyrights(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("copyright", "filepath", "additional_info")
+
+    _json_attributes = {"filePath": "filepath"}
+
     def __init__(
         self,
         copyright: str,
@@ -662,20 +1104,14 @@ class UploadCopyrights(object):
         **kwargs,
     ):
         self.copyright = copyright
-        self.filepath = list()
-        for path in filePath:
-            self.filepath.append(path)
-        self.additional_info = kwargs
+        self.filepath = filePath
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"Copyright {self.copyright} was found in {len(self.filepath)} files."
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class UploadLicenses(object):
+class UploadLicenses(_JsonModel):
     """FOSSology upload licenses.
 
     Represents licenses and copyright matches of a FOSSology upload.
@@ -688,6 +1124,12 @@ class UploadLicenses(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("filepath", "_findings_raw", "additional_info")
+
+    _json_attributes = {"filePath": "filepath", "findings": "_findings_raw"}
+
+    findings = _LazyJson(Findings.from_json)
+
     def __init__(
         self,
         filePath: str,
@@ -695,18 +1137,17 @@ class UploadLicenses(object):
         **kwargs,
     ):
         self.filepath = filePath
-        self.findings = Findings.from_json(findings)
-        self.additional_info = kwargs
+        self.findings = findings
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
-        return f"File {self.filepath} has {len(self.findings.conclusion)} license and {len(self.findings.copyright)}matches"
+        findings = self.findings
+        licenses = len(findings.conclusion) if findings and findings.conclusion else 0
+        copyrights = len(findings.copyright) if findings and findings.copyright else 0
+        return f"File {self.filepath} has {licenses} license and {copyrights}matches"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
 
-
-class Summary(object):
+class Summary(_JsonModel):
     """FOSSology upload summary.
 
     Represents a FOSSology upload summary.
@@ -737,6 +1178,23 @@ class Summary(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "id",
+        "uploadName",
+        "mainLicense",
+        "uniqueLicenses",
+        "totalLicenses",
+        "uniqueConcludedLicenses",
+        "totalConcludedLicenses",
+        "filesToBeCleared",
+        "filesCleared",
+        "clearingStatus",
+        "copyrightCount",
+        "additional_info",
+    )
+
+    _json_converters = {"clearingStatus": _intern_value}
+
     def __init__(
         self,
         id,
@@ -761,9 +1219,9 @@ class Summary(object):
         self.totalConcludedLicenses = totalConcludedLicenses
         self.filesToBeCleared = filesToBeCleared
         self.filesCleared = filesCleared
-        self.clearingStatus = clearingStatus
+        self.clearingStatus = _intern_value(clearingStatus)
         self.copyrightCount = copyrightCount
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return (
@@ -771,12 +1229,8 @@ class Summary(object):
             f" main license = {self.mainLicense}"
         )
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class Job(object):
+class Job(_JsonModel):
     """FOSSology job.
 
     Represents a FOSSology job.
@@ -801,6 +1255,21 @@ class Job(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "queueDate",
+        "uploadId",
+        "userId",
+        "groupId",
+        "eta",
+        "status",
+        "additional_info",
+        "_queueDate_dt",
+    )
+
+    _json_converters = {"status": _intern_value}
+
     def __init__(
         self, id, name, queueDate, uploadId, userId, groupId, eta, status, **kwargs
     ):
@@ -811,8 +1280,8 @@ class Job(object):
         self.userId = userId
         self.groupId = groupId
         self.eta = eta
-        self.status = status
-        self.additional_info = kwargs
+        self.status = _intern_value(status)
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return (
@@ -820,12 +1289,17 @@ class Job(object):
             f"(Status: {self.status} ETA: {self.eta})"
         )
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
+    @property
+    def queueDate_dt(self):
+        """The queue date as :class:`datetime.datetime`, parsed on first access"""
+        try:
+            return self._queueDate_dt
+        except AttributeError:
+            self._queueDate_dt = _parse_timestamp(self.queueDate)
+            return self._queueDate_dt
 
 
-class ApiLicense(object):
+class ApiLicense(_JsonModel):
     """FOSSology API License.
 
     :param name: name of the API license
@@ -834,6 +1308,8 @@ class ApiLicense(object):
     :type url: string
     """
 
+    __slots__ = ("name", "url")
+
     def __init__(self, name, url):
         self.name = name
         self.url = url
@@ -841,12 +1317,8 @@ class ApiLicense(object):
     def __str__(self):
         return f"API license '{self.name}' ({self.url})"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class FossologyServer(object):
+class FossologyServer(_JsonModel):
     """FOSSology server info.
 
     :param version: version of the FOSSology server (e.g. 4.0.0)
@@ -861,6 +1333,8 @@ class FossologyServer(object):
     :type buildDate: string
     """
 
+    __slots__ = ("version", "branchName", "commitHash", "commitDate", "buildDate")
+
     def __init__(self, version, branchName, commitHash, commitDate, buildDate):
         self.version = version
         self.branchName = branchName
@@ -871,12 +1345,8 @@ class FossologyServer(object):
     def __str__(self):
         return f"Fossology server version {self.version} (branch {self.branchName} - {self.commitHash})"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
 
-
-class ApiInfo(object):
+class ApiInfo(_JsonModel):
     """FOSSology API info.
 
     Represents the info endpoint of FOSSology API.
@@ -898,6 +1368,22 @@ class ApiInfo(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "version",
+        "security",
+        "contact",
+        "_license_raw",
+        "_fossology_raw",
+        "additional_info",
+    )
+
+    _json_attributes = {"license": "_license_raw", "fossology": "_fossology_raw"}
+
+    license = _LazyJson(ApiLicense.from_json)
+    fossology = _LazyJson(FossologyServer.from_json)
+
     def __init__(
         self,
         name,
@@ -914,19 +1400,15 @@ class ApiInfo(object):
         self.version = version
         self.security = security
         self.contact = contact
-        self.license = ApiLicense.from_json(license)
-        self.fossology = FossologyServer.from_json(fossology)
-        self.additional_info = kwargs
+        self.license = license
+        self.fossology = fossology
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"{self.name} is deployed with version {self.version}"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class Status(object):
+class Status(_JsonModel):
     """FOSSology server status
 
     Represent the status of FOSSology sub-systems
@@ -935,15 +1417,13 @@ class Status(object):
     :type status: string
     """
 
+    __slots__ = ("status",)
+
     def __init__(self, status):
         self.status = status
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class HealthInfo(object):
+class HealthInfo(_JsonModel):
     """FOSSology server health info.
 
     Represents the health endpoint of FOSSology API.
@@ -957,20 +1437,24 @@ class HealthInfo(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("status", "_scheduler_raw", "_db_raw")
+
+    _json_attributes = {"scheduler": "_scheduler_raw", "db": "_db_raw"}
+    _json_extra = None
+
+    scheduler = _LazyJson(Status.from_json)
+    db = _LazyJson(Status.from_json)
+
     def __init__(self, status, scheduler, db, **kwargs):
         self.status = status
-        self.scheduler = Status.from_json(scheduler)
-        self.db = Status.from_json(db)
+        self.scheduler = scheduler
+        self.db = db
 
     def __str__(self):
         return f"FOSSology server status is: {self.status} (Scheduler: {self.scheduler.status} - DB: {self.db.status})"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class SearchResult(object):
+class SearchResult(_JsonModel):
     """Search result.
 
     Represents a search response from FOSSology API.
@@ -985,21 +1469,24 @@ class SearchResult(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("_upload_raw", "uploadTreeId", "filename", "additional_info")
+
+    _repr_field = "uploadTreeId"
+    _json_attributes = {"upload": "_upload_raw"}
+
+    upload = _LazyJson(Upload.from_json)
+
     def __init__(self, upload, uploadTreeId, filename, **kwargs):
-        self.upload = Upload.from_json(upload)
+        self.upload = upload
         self.uploadTreeId = uploadTreeId
         self.filename = filename
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"File found in upload {self.upload.uploadname} ({self.uploadTreeId}): {self.filename}"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class GetClearingHistory(object):
+class GetClearingHistory(_JsonModel):
     """Clearing history.
 
     Represents the clearing history of a specified item.
@@ -1020,6 +1507,18 @@ class GetClearingHistory(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "date",
+        "username",
+        "scope",
+        "type",
+        "addedLicenses",
+        "removedLicenses",
+        "additional_info",
+    )
+
+    _json_converters = {"scope": ClearingScope, "type": ClearingType}
+
     def __init__(
         self,
         date: str,
@@ -1036,17 +1535,13 @@ class GetClearingHistory(object):
         self.type = ClearingType(type)
         self.addedLicenses = addedLicenses
         self.removedLicenses = removedLicenses
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"{self.username} changed clearing history at {self.date} in {self.scope} (type: {self.type})"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class GetBulkHistory(object):
+class GetBulkHistory(_JsonModel):
     """Bulk history.
 
     Represents the bulk history of a specified item.
@@ -1069,6 +1564,17 @@ class GetBulkHistory(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = (
+        "bulkId",
+        "clearingEventId",
+        "text",
+        "matched",
+        "tried",
+        "addedLicenses",
+        "removedLicenses",
+        "additional_info",
+    )
+
     def __init__(
         self,
         bulkId: int,
@@ -1087,17 +1593,13 @@ class GetBulkHistory(object):
         self.tried = tried
         self.addedLicenses = addedLicenses
         self.removedLicenses = removedLicenses
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"Bulk Id {self.bulkId} associated with {self.clearingEventId} | Search for {self.text}"
 
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
-
 
-class GetPrevNextItem(object):
+class GetPrevNextItem(_JsonModel):
     """PrevNext item for the clearing history.
 
     Represents the prev-next item list for the clearing history.
@@ -1110,6 +1612,8 @@ class GetPrevNextItem(object):
     :type kwargs: key word argument
     """
 
+    __slots__ = ("prevItemId", "nextItemId", "additional_info")
+
     def __init__(
         self,
         prevItemId: int,
@@ -1118,11 +1622,7 @@ class GetPrevNextItem(object):
     ):
         self.prevItemId = prevItemId
         self.nextItemId = nextItemId
-        self.additional_info = kwargs
+        self.additional_info = kwargs or _EMPTY
 
     def __str__(self):
         return f"Prev: {self.prevItemId} | Next: {self.nextItemId}"
-
-    @classmethod
-    def from_json(cls, json_dict):
-        return cls(**json_dict)
@@ -5,17 +5,20 @@
 import logging
 import re
 import time
-from typing import Tuple
+from typing import BinaryIO, Tuple, overload
 
 from tenacity import TryAgain, retry, retry_if_exception_type, stop_after_attempt
 
 from fossology.enums import ReportFormat
 from fossology.exceptions import AuthorizationError, FossologyApiError
+from fossology.jsonutils import decode_json
 from fossology.obj import Upload
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+_REPORT_NAME_PATTERN = re.compile("(^attachment; filename=)(\"|')?([^\"|']*)(\"|'$)?")
+
 
 class Report:
     """Class dedicated to all "report" related endpoints"""
@@ -44,7 +47,7 @@ class Report:
         """
         headers = {"uploadId": str(upload.id)}
         if report_format:
-            headers["reportFormat"] = report_format.value
+            headers["reportFormat"] = report_format
         else:
             headers["reportFormat"] = "readmeoss"
         if group:
@@ -53,8 +56,9 @@ class Report:
         response = self.session.get(f"{self.api}/report", headers=headers)
 
         if response.status_code == 201:
-            report_id = re.search("[0-9]*$", response.json()["message"])
-            return report_id[0]  # type: ignore
+            # The report id is the number ending the message
+            message = decode_json(response.content)["message"]
+            return message[len(message.rstrip("0123456789")) :]
 
         elif response.status_code == 403:
             description = f"Report generation for upload {upload.id} not authorized"
@@ -70,10 +74,33 @@ class Report:
             description = f"Report generation for upload {upload.uploadname} failed"
             raise FossologyApiError(description, response)
 
+    @overload
+    def download_report(
+        self,
+        report_id: int,
+        group: str | None = None,
+        wait_time: int = 0,
+        sink: None = None,
+    ) -> Tuple[bytes, str]: ...
+
+    @overload
+    def download_report(
+        self,
+        report_id: int,
+        group: str | None = None,
+        wait_time: int = 0,
+        *,
+        sink: BinaryIO,
+    ) -> Tuple[None, str]: ...
+
     @retry(retry=retry_if_exception_type(TryAgain), stop=stop_after_attempt(10))
     def download_report(
-        self, report_id: int, group: str | None = None, wait_time: int = 0
-    ) -> Tuple[str, str]:
+        self,
+        report_id: int,
+        group: str | None = None,
+        wait_time: int = 0,
+        sink: BinaryIO | None = None,
+    ) -> Tuple[bytes | None, str]:
         """Download a report
 
         API Endpoint: GET /report/{id}
@@ -83,6 +110,8 @@ class Report:
 
         If ``wait_time`` is 0, the time interval specified by the ``Retry-After`` header is used.
 
+        Large reports can be streamed to a binary file-like ``sink`` instead of being held in memory.
+
         The function stops trying after **10 attempts**.
 
         :Example:
@@ -101,11 +130,13 @@ class Report:
         :param report_id: the id of the generated report
         :param group: the group name to choose while downloading a specific report (default: None)
         :param wait_time: use a customized upload wait time instead of Retry-After (in seconds, default: 0)
+        :param sink: write the report content to this file object instead of returning it (default: None)
         :type report_id: int
         :type group: string
         :type wait_time: int
-        :return: the report content and the report name
-        :rtype: Tuple[str, str]
+        :type sink: BinaryIO
+        :return: the report content (None if written to ``sink``) and the report name
+        :rtype: Tuple[bytes | None, str]
         :raises FossologyApiError: if the REST call failed
         :raises AuthorizationError: if the REST call is not authorized
         :raises TryAgain: if the report generation times out after 10 retries
@@ -114,13 +145,18 @@ class Report:
         if group:
             headers["groupName"] = group
 
-        response = self.session.get(f"{self.api}/report/{report_id}", headers=headers)
+        response = self.session.get(
+            f"{self.api}/report/{report_id}", headers=headers, stream=sink is not None
+        )
 
         if response.status_code == 200:
             content = response.headers["Content-Disposition"]
-            report_name_pattern = "(^attachment; filename=)(\"|')?([^\"|']*)(\"|'$)?"
-            report_name = re.match(report_name_pattern, content).group(3)  # type: ignore
-            return response.content, report_name
+            report_name = _REPORT_NAME_PATTERN.match(content).group(3)  # type: ignore
+            if sink is None:
+                return response.content, report_name
+            for chunk in response.iter_content(chunk_size=1 << 16):
+                sink.write(chunk)
+            return None, report_name
 
         elif response.status_code == 403:
             description = f"Download of report {report_id} not authorized"
@@ -130,7 +166,7 @@ class Report:
             if not wait_time:
                 wait_time = response.headers["Retry-After"]
             logger.debug(
-                f"Retry GET report {report_id} after {wait_time} seconds: {response.json()['message']}"
+                f"Retry GET report {report_id} after {wait_time} seconds: {decode_json(response.content)['message']}"
             )
             time.sleep(int(wait_time))
             raise TryAgain
@@ -2,14 +2,20 @@
 # Copyright 2023 Siemens AG
 # SPDX-License-Identifier: MIT
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from fossology.enums import SearchTypes
 from fossology.exceptions import AuthorizationError, FossologyApiError
+from fossology.jsonutils import decode_json
 from fossology.obj import File, SearchResult, Upload
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Requests in flight at once when all pages of a search are fetched
+SEARCH_PAGE_WORKERS = 8
+
 
 def search_headers(
     searchType: SearchTypes = SearchTypes.ALLFILES,
@@ -23,7 +29,7 @@ def search_headers(
     group: str | None = None,
     page_size: int = 100,
 ) -> dict:
-    headers = {"searchType": searchType.value}
+    headers: dict[str, str] = {"searchType": str(searchType)}
     if upload:
         headers["uploadId"] = str(upload.id)
     if filename:
@@ -108,35 +114,37 @@ class Search:
             page_size,
         )
 
-        results_list = list()
-        if all_pages:
-            # will be reset after the total number of pages has been retrieved from the API
-            x_total_pages = 2
-        else:
-            x_total_pages = page
-        while page <= x_total_pages:
-            headers["page"] = str(page)
-            response = self.session.get(f"{self.api}/search", headers=headers)
-
-            if response.status_code == 200:
-                for result in response.json():
-                    results_list.append(SearchResult.from_json(result))
-
-                x_total_pages = int(response.headers.get("X-TOTAL-PAGES", 0))
-                if not all_pages or x_total_pages == 0:
-                    logger.info(
-                        f"Retrieved page {page} of uploads, {x_total_pages} pages are in total available"
-                    )
-                    return results_list, x_total_pages
-                page += 1
-
-            else:
-                description = "Unable to get a result with the given search criteria"
-                raise FossologyApiError(description, response)
+        response = self._get_search_page(headers, page)
+        results_list = SearchResult.from_json_list(decode_json(response.content))
+        x_total_pages = int(response.headers.get("X-TOTAL-PAGES", 0))
+        if not all_pages or x_total_pages == 0:
+            logger.info(
+                f"Retrieved page {page} of uploads, {x_total_pages} pages are in total available"
+            )
+            return results_list, x_total_pages
+
+        # The remaining pages are independent requests, fetch them concurrently
+        with ThreadPoolExecutor(max_workers=SEARCH_PAGE_WORKERS) as executor:
+            for response in executor.map(
+                partial(self._get_search_page, headers),
+                range(page + 1, x_total_pages + 1),
+            ):
+                results_list.extend(
+                    SearchResult.from_json_list(decode_json(response.content))
+                )
 
         logger.info(f"Retrieved all {x_total_pages} of search results")
         return results_list, x_total_pages
 
+    def _get_search_page(self, headers: dict, page: int):
+        response = self.session.get(
+            f"{self.api}/search", headers={**headers, "page": str(page)}
+        )
+        if response.status_code != 200:
+            description = "Unable to get a result with the given search criteria"
+            raise FossologyApiError(description, response)
+        return response
+
     def filesearch(
         self,
         filelist: list | None = None,
@@ -166,13 +174,12 @@ class Search:
         )
 
         if response.status_code == 200:
-            all_files = []
-            for hash_file in response.json():
-                if hash_file.get("findings"):
-                    all_files.append(File.from_json(hash_file))
-                else:
+            files = []
+            for hash_file in decode_json(response.content):
+                if not hash_file.get("findings"):
                     return "Unable to get a result with the given filesearch criteria"
-            return all_files
+                files.append(File.from_json(hash_file))
+            return files
 
         elif response.status_code == 403:
             description = (
@@ -3,15 +3,35 @@
 # SPDX-License-Identifier: MIT
 import json
 import logging
+import os
 import re
 import time
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, Tuple
 
 import requests
-from tenacity import TryAgain, retry, retry_if_exception_type, stop_after_attempt
+from tenacity import (
+    TryAgain,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+try:
+    from requests_toolbelt import MultipartEncoder  # type: ignore
+except ImportError:
+    MultipartEncoder = None
 
 from fossology.enums import AccessLevel, ClearingStatus
-from fossology.exceptions import AuthorizationError, FossologyApiError
+from fossology.exceptions import (
+    AuthorizationError,
+    Error,
+    FossologyApiError,
+    FossologyBulkError,
+)
+from fossology.jsonutils import decode_json
 from fossology.obj import (
     Folder,
     Group,
@@ -48,7 +68,7 @@ def list_uploads_parameters(
     if name:
         params["name"] = name
     if status:
-        params["status"] = status.value
+        params["status"] = status
     if assignee:
         params["assignee"] = assignee
     if since:
@@ -65,6 +85,47 @@ def list_uploads_parameters(
     return params
 
 
+# Requests in flight at once for the operations on several uploads
+UPLOAD_REQUEST_WORKERS = 8
+
+# Retry while the unpack agent didn't start yet. Agents of small uploads start
+# within a second, so poll quickly at first: wait 0.2, 0.4, 0.8, 1.6 and 3 s,
+# which gives at most 6 requests and the same 6 s of waiting as the former
+# 3 requests 3 s apart
+_UNPACK_RETRY = retry(
+    retry=retry_if_exception_type(TryAgain),
+    wait=wait_exponential(multiplier=0.2, max=3),
+    stop=stop_after_attempt(6),
+)
+
+
+def _for_each_upload(operation, uploads: Iterable[Upload], description: str):
+    """Run ``operation`` for all uploads concurrently and report all failures
+
+    :raises FossologyBulkError: listing the uploads whose request failed, after all
+        other requests were performed
+    """
+
+    def run(upload):
+        try:
+            operation(upload)
+        except (Error, requests.exceptions.RequestException) as error:
+            return error
+        return None
+
+    uploads = list(uploads)
+    with ThreadPoolExecutor(max_workers=UPLOAD_REQUEST_WORKERS) as executor:
+        failures = [
+            (upload, error)
+            for upload, error in zip(uploads, executor.map(run, uploads))
+            if error is not None
+        ]
+    if failures:
+        raise FossologyBulkError(
+            f"{description} {len(failures)} of {len(uploads)} uploads", failures
+        )
+
+
 class Uploads:
     """Class dedicated to all "uploads" related endpoints"""
 
@@ -111,7 +172,7 @@ class Uploads:
 
         if response.status_code == 200:
             logger.debug(f"Got details for upload {upload_id}")
-            return Upload.from_json(response.json())
+            return Upload.from_json(decode_json(response.content))
 
         elif response.status_code == 403:
             description = f"Getting details for upload {upload_id} is not authorized"
@@ -121,7 +182,7 @@ class Uploads:
             if not wait_time:
                 wait_time = response.headers["Retry-After"]
             logger.debug(
-                f"Retry GET upload {upload_id} after {wait_time} seconds: {response.json()['message']}"
+                f"Retry GET upload {upload_id} after {wait_time} seconds: {decode_json(response.content)['message']}"
             )
             time.sleep(int(wait_time))
             raise TryAgain
@@ -240,9 +301,7 @@ class Uploads:
         data: dict = {
             "folderId": str(folder.id),
             "uploadDescription": description,
-            "public": access_level.value
-            if access_level
-            else AccessLevel.PROTECTED.value,
+            "public": access_level if access_level else AccessLevel.PROTECTED,
             "applyGlobal": apply_global,
             "ignoreScm": ignore_scm,
             "uploadType": "file",
@@ -264,10 +323,22 @@ class Uploads:
         if file:
             data["uploadType"] = headers["uploadType"] = "file"
             with open(file, "rb") as fp:
-                files = {"fileInput": fp}
-                response = self.session.post(
-                    endpoint, files=files, headers=headers, data=data
-                )
+                if MultipartEncoder:
+                    # Stream the file instead of building the whole body in memory
+                    fields: list = [
+                        (key, str(value))
+                        for key, value in data.items()
+                        if value is not None
+                    ]
+                    fields.append(("fileInput", (os.path.basename(file), fp)))
+                    body = MultipartEncoder(fields)
+                    headers["Content-Type"] = body.content_type
+                    response = self.session.post(endpoint, data=body, headers=headers)
+                else:
+                    files = {"fileInput": fp}
+                    response = self.session.post(
+                        endpoint, files=files, headers=headers, data=data
+                    )
         elif vcs or url or server:
             if vcs:
                 data["location"] = vcs  # type: ignore
@@ -302,7 +373,7 @@ class Uploads:
         if response.status_code == 201:
             try:
                 upload = self.detail_upload(
-                    response.json()["message"], group, wait_time
+                    decode_json(response.content)["message"], group, wait_time
                 )
                 logger.info(
                     f"Upload {upload.uploadname} ({upload.hash.size}) "
@@ -321,7 +392,7 @@ class Uploads:
             description = f"Upload {description} could not be performed"
             raise FossologyApiError(description, response)
 
-    @retry(retry=retry_if_exception_type(TryAgain), stop=stop_after_attempt(3))
+    @_UNPACK_RETRY
     def upload_summary(self, upload: Upload, group=None):
         """Get clearing information about an upload
 
@@ -344,7 +415,7 @@ class Uploads:
         )
 
         if response.status_code == 200:
-            return Summary.from_json(response.json())
+            return Summary.from_json(decode_json(response.content))
 
         elif response.status_code == 403:
             description = f"Getting summary of upload {upload.id} is not authorized"
@@ -354,13 +425,12 @@ class Uploads:
             logger.debug(
                 f"Unpack agent for {upload.uploadname} (id={upload.id}) didn't start yet"
             )
-            time.sleep(3)
             raise TryAgain
         else:
             description = f"No summary for upload {upload.uploadname} (id={upload.id})"
             raise FossologyApiError(description, response)
 
-    @retry(retry=retry_if_exception_type(TryAgain), stop=stop_after_attempt(3))
+    @_UNPACK_RETRY
     def upload_licenses(
         self,
         upload: Upload,
@@ -411,12 +481,7 @@ class Uploads:
         )
 
         if response.status_code == 200:
-            all_licenses = []
-            scanned_files = response.json()
-            for file_with_findings in scanned_files:
-                file_licenses = UploadLicenses.from_json(file_with_findings)
-                all_licenses.append(file_licenses)
-            return all_licenses
+            return UploadLicenses.from_json_list(decode_json(response.content))
 
         elif response.status_code == 403:
             description = f"Getting licenses for upload {upload.id} is not authorized"
@@ -428,14 +493,13 @@ class Uploads:
 
         elif response.status_code == 503:
             logger.debug("The ununpack agent or queried agents have not started yet.")
-            time.sleep(3)
             raise TryAgain
 
         else:
             description = f"API error while returning license findings for upload {upload.uploadname} (id={upload.id})"
             raise FossologyApiError(description, response)
 
-    @retry(retry=retry_if_exception_type(TryAgain), stop=stop_after_attempt(3))
+    @_UNPACK_RETRY
     def upload_copyrights(
         self,
         upload: Upload,
@@ -454,10 +518,7 @@ class Uploads:
         response = self.session.get(f"{self.api}/uploads/{upload.id}/copyrights")
 
         if response.status_code == 200:
-            all_copyrights = []
-            for copyright in response.json():
-                all_copyrights.append(UploadCopyrights.from_json(copyright))
-            return all_copyrights
+            return UploadCopyrights.from_json_list(decode_json(response.content))
 
         elif response.status_code == 403:
             description = f"Getting copyrights for upload {upload.id} is not authorized"
@@ -469,7 +530,6 @@ class Uploads:
 
         elif response.status_code == 503:
             logger.debug("The ununpack agent or queried agents have not started yet.")
-            time.sleep(3)
             raise TryAgain
 
         else:
@@ -506,6 +566,22 @@ class Uploads:
             description = f"Unable to delete upload {upload.id}"
             raise FossologyApiError(description, response)
 
+    def delete_uploads(self, uploads: Iterable[Upload], group: str | None = None):
+        """Delete several uploads, sending the requests concurrently
+
+        API Endpoint: DELETE /uploads/{id}
+
+        :param uploads: the uploads to be deleted
+        :param group: the group name to chose while deleting the uploads (default: None)
+        :type uploads: list of Upload
+        :type group: string
+        :raises FossologyBulkError: if some of the REST calls failed, the other
+            uploads are deleted
+        """
+        _for_each_upload(
+            partial(self.delete_upload, group=group), uploads, "Unable to delete"
+        )
+
     def list_uploads(
         self,
         folder: Folder | None = None,
@@ -575,8 +651,9 @@ class Uploads:
                 f"{self.api}/uploads", headers=headers, params=params
             )
             if response.status_code == 200:
-                for upload in response.json():
-                    uploads_list.append(Upload.from_json(upload))
+                uploads_list.extend(
+                    Upload.from_json_list(decode_json(response.content))
+                )
                 x_total_pages = int(response.headers.get("X-TOTAL-PAGES", 0))
                 if not all_pages or x_total_pages == 0:
                     logger.info(
@@ -623,7 +700,7 @@ class Uploads:
         params = dict()
         headers = dict()
         if status:
-            params["status"] = status.value
+            params["status"] = status
         if assignee:
             params["assignee"] = assignee.id  # type: ignore
         if group:
@@ -680,6 +757,26 @@ class Uploads:
             )
             raise FossologyApiError(description, response)
 
+    def move_uploads(self, uploads: Iterable[Upload], folder: Folder, action: str):
+        """Copy or move several uploads, sending the requests concurrently
+
+        API Endpoint: PUT /uploads/{id}
+
+        :param uploads: the Uploads to be copied or moved in another folder
+        :param folder: the destination Folder
+        :param action: the action to be performed, 'copy' or 'move'
+        :type uploads: list of Upload
+        :type folder: Folder
+        :type action: str
+        :raises FossologyBulkError: if some of the REST calls failed, the other
+            uploads are copied or moved
+        """
+        _for_each_upload(
+            partial(self.move_upload, folder=folder, action=action),
+            uploads,
+            f"Unable to {action}",
+        )
+
     def download_upload(self, upload: Upload) -> Tuple[str, str]:
         """Download an upload by its id
 
@@ -791,7 +888,7 @@ class Uploads:
         """
         response = self.session.get(f"{self.api}/uploads/{upload.id}/perm-groups")
         if response.status_code == 200:
-            return UploadPermGroups.from_json(response.json())
+            return UploadPermGroups.from_json(decode_json(response.content))
 
         elif response.status_code == 403:
             description = (
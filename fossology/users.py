@@ -4,7 +4,8 @@
 import logging
 
 from fossology.exceptions import FossologyApiError
-from fossology.obj import Agents, User
+from fossology.jsonutils import decode_json
+from fossology.obj import User
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -26,13 +27,7 @@ class Users:
         """
         response = self.session.get(f"{self.api}/users/{user_id}")
         if response.status_code == 200:
-            user_agents = None
-            user_details = response.json()
-            if user_details.get("agents"):
-                user_agents = Agents.from_json(user_details["agents"])
-            user = User.from_json(user_details)
-            user.agents = user_agents
-            return user
+            return User.from_json(decode_json(response.content))
         else:
             description = f"Error while getting details for user {user_id}"
             raise FossologyApiError(description, response)
@@ -49,15 +44,11 @@ class Users:
         response = self.session.get(f"{self.api}/users")
         if response.status_code == 200:
             users_list = list()
-            for user in response.json():
+            for user in decode_json(response.content):
                 if user.get("name") == "Default User":
                     continue
                 if user.get("email"):
-                    foss_user = User.from_json(user)
-                    agents = user.get("agents")
-                    if agents:
-                        foss_user.agents = Agents.from_json(agents)
-                    users_list.append(foss_user)
+                    users_list.append(User.from_json(user))
             return users_list
         else:
             description = f"Unable to get a list of users from {self.host}"
@@ -0,0 +1,40 @@
+# Copyright 2026 Siemens AG
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+
+from fossology.enums import AccessLevel, JobStatus, MemberPerm, Permission
+
+
+def test_enum_lookup_by_value():
+    assert AccessLevel("public") is AccessLevel.PUBLIC
+    assert AccessLevel(AccessLevel.PUBLIC) is AccessLevel.PUBLIC
+    assert Permission("10") is Permission.ADMIN
+    assert Permission(Permission.ADMIN) is Permission.ADMIN
+
+
+def test_enum_lookup_of_unknown_value_raises_value_error():
+    with pytest.raises(ValueError):
+        AccessLevel("secret")
+    with pytest.raises(ValueError):
+        Permission(["10"])
+
+
+def test_enums_serialize_as_their_values():
+    assert JobStatus.COMPLETED == "Completed"
+    assert json.dumps({"perm": MemberPerm.ADMIN, "publicPerm": Permission.NONE}) == (
+        '{"perm": 1, "publicPerm": "0"}'
+    )
+
+
+def test_str_enums_format_as_their_values():
+    assert f"?access={AccessLevel.PRIVATE}" == "?access=private"
+    assert str(Permission.ADMIN) == "10"
+
+
+def test_int_enums_format_as_their_values():
+    assert f"?perm={MemberPerm.ADMIN}" == "?perm=1"
+    assert f"{MemberPerm.ADVISOR:02d}" == "02"
+    assert str(MemberPerm.USER) == "0"
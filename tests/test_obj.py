@@ -0,0 +1,666 @@
+# Copyright 2026 Siemens AG
+# SPDX-License-Identifier: MIT
+
+import copy
+import json
+import pickle
+from datetime import datetime, timezone
+
+import pytest
+
+from fossology.enums import JobStatus, Permission
+from fossology.obj import (
+    Agents,
+    ApiInfo,
+    ApiLicense,
+    File,
+    FileInfo,
+    Findings,
+    Folder,
+    FossologyServer,
+    GetBulkHistory,
+    GetClearingHistory,
+    GetPrevNextItem,
+    Group,
+    Hash,
+    HealthInfo,
+    Job,
+    License,
+    Obligation,
+    PermGroups,
+    SearchResult,
+    Status,
+    Summary,
+    Upload,
+    UploadBatch,
+    UploadCopyrights,
+    UploadLicenses,
+    UploadPermGroups,
+    User,
+    UserGroupMember,
+    _JsonModel,
+)
+
+
+def test_additional_info_is_shared_when_empty():
+    folder = Folder(1, "Software Repository", "Top folder", None)
+    other_folder = Folder(2, "Test folder", "", 1)
+    assert not folder.additional_info
+    assert folder.additional_info is other_folder.additional_info
+    with pytest.raises(TypeError):
+        folder.additional_info["foo"] = "bar"
+    assert isinstance(folder.additional_info, dict)
+    assert json.dumps(folder.additional_info) == "{}"
+    assert copy.deepcopy(folder).additional_info is folder.additional_info
+
+
+def test_objects_have_no_instance_dict():
+    folder = Folder(1, "Software Repository", "Top folder", None)
+    assert not hasattr(folder, "__dict__")
+    with pytest.raises(AttributeError):
+        folder.size = 42
+
+
+def test_objects_can_be_pickled():
+    folder = pickle.loads(pickle.dumps(Folder(1, "Software Repository", "", None)))
+    assert folder.name == "Software Repository"
+    assert folder.additional_info is Folder(2, "Test", "", 1).additional_info
+    folder = pickle.loads(pickle.dumps(Folder(1, "Software Repository", "", None, x=1)))
+    assert folder.additional_info == {"x": 1}
+
+
+def test_additional_info_keeps_unknown_fields():
+    summary = Summary.from_json(
+        {
+            "id": 1,
+            "uploadName": "base-files_11.tar.xz",
+            "mainLicense": None,
+            "uniqueLicenses": 1,
+            "totalLicenses": 2,
+            "uniqueConcludedLicenses": 0,
+            "totalConcludedLicenses": 0,
+            "filesToBeCleared": 2,
+            "filesCleared": 0,
+            "clearingStatus": "Open",
+            "copyrightCount": 3,
+            "assignee": 2,
+        }
+    )
+    assert summary.additional_info == {"assignee": 2}
+
+
+def test_attribute_errors_of_properties_are_not_hidden():
+    upload = Upload(1, "Software Repository", 2, "", "a.tar.xz", "")
+    del upload._hash_raw
+    with pytest.raises(AttributeError, match="_hash_raw"):
+        upload.filesize
+    with pytest.raises(AttributeError, match="'foo'"):
+        HealthInfo("OK", {"status": "OK"}, {"status": "OK"}).foo
+
+
+def test_agents_to_dict_includes_additional_agents():
+    agents = Agents(True, True, False, False, True, True, True, False, True)
+    assert agents.additional_agents == {}
+    assert list(agents.to_dict()) == [
+        "bucket",
+        "copyright_email_author",
+        "ecc",
+        "keyword",
+        "mimetype",
+        "monk",
+        "nomos",
+        "ojo",
+        "package",
+    ]
+    agents = Agents(True, True, False, False, True, True, True, False, True, reso=True)
+    assert agents.to_dict()["reso"] is True
+
+
+def test_job_status_is_interned():
+    job_data = '{"id": 1, "name": "job", "queueDate": "2023-08-07 10:00:00", "uploadId": 2, "userId": 3, "groupId": 3, "eta": 0, "status": "Completed"}'
+    first_job = Job.from_json(json.loads(job_data))
+    second_job = Job.from_json(json.loads(job_data))
+    assert first_job.status == JobStatus.COMPLETED.value
+    assert first_job.status is second_job.status
+
+
+def test_known_status_values_are_shared():
+    summary_data = '{"id": 1, "uploadName": "base-files_11.tar.xz", "mainLicense": "GPL-2.0-only", "uniqueLicenses": 1, "totalLicenses": 2, "uniqueConcludedLicenses": 0, "totalConcludedLicenses": 0, "filesToBeCleared": 2, "filesCleared": 0, "clearingStatus": "Open", "copyrightCount": 3}'
+    first_summary = Summary.from_json(json.loads(summary_data))
+    second_summary = Summary.from_json(json.loads(summary_data))
+    assert first_summary.clearingStatus is second_summary.clearingStatus
+    assert first_summary.mainLicense == second_summary.mainLicense
+
+
+def test_job_queue_date_is_parsed_once():
+    job = Job(1, "job", "2023-08-17 08:39:04.38+00", 2, 3, 3, 0, "Completed")
+    assert job.queueDate_dt == datetime(2023, 8, 17, 8, 39, 4, 380000, timezone.utc)
+    assert job.queueDate_dt is job.queueDate_dt
+    assert job.queueDate == "2023-08-17 08:39:04.38+00"
+
+
+def test_upload_from_json_renames_camel_case_keys():
+    upload_data = {
+        "folderId": 1,
+        "folderName": "Software Repository",
+        "id": 2,
+        "description": "",
+        "uploadName": "base-files_11.tar.xz",
+        "uploadDate": "2023-08-07 10:00:00",
+        "hash": {"sha1": "abc", "md5": "def", "sha256": "ghi", "size": 42},
+    }
+    upload = Upload.from_json(upload_data)
+    assert upload.folderid == 1
+    assert upload.foldername == "Software Repository"
+    assert upload.uploadname == "base-files_11.tar.xz"
+    assert upload.uploaddate == "2023-08-07 10:00:00"
+    assert upload.uploaddate_dt == datetime(2023, 8, 7, 10)
+    assert upload.hash.size == 42
+    assert "folderId" in upload_data
+    upload = Upload.from_json(
+        {**upload_data, "assignee": "alice", "closingDate": "2023-08-08 10:00:00"}
+    )
+    assert upload.assignee == "alice"
+    assert upload.assigneeDate is None
+    assert upload.closeDate == "2023-08-08 10:00:00"
+
+
+def test_file_info_from_json_reads_camel_case_keys():
+    info_data = {
+        "viewInfo": {"itemId": 1},
+        "metaInfo": {"mimeType": "text/plain"},
+        "packageInfo": {},
+        "tagInfo": [],
+        "reuseInfo": {},
+    }
+    info = FileInfo.from_json(info_data)
+    assert info.view_info == {"itemId": 1}
+    assert info.meta_info == {"mimeType": "text/plain"}
+    assert not info.additional_info
+    assert "viewInfo" in info_data
+
+
+def test_from_json_list_keeps_record_order():
+    folders = Folder.from_json_list(
+        [
+            {"id": 1, "name": "Software Repository", "description": "", "parent": None},
+            {"id": 2, "name": "Test folder", "description": "", "parent": 1},
+        ]
+    )
+    assert [folder.id for folder in folders] == [1, 2]
+    assert all(isinstance(folder, Folder) for folder in folders)
+    assert Folder.from_json_list([]) == []
+
+
+def test_from_json_with_missing_field_raises_type_error():
+    with pytest.raises(TypeError):
+        Folder.from_json({"id": 1, "name": "Software Repository"})
+
+
+def test_generated_from_json_matches_constructor():
+    user_data = {
+        "id": 2,
+        "name": "fossy",
+        "description": "super user",
+        "email": "fossy@localhost",
+        "accessLevel": "admin",
+        "rootFolderId": 1,
+        "emailNotification": True,
+        "agents": {"bucket": True},
+    }
+    user = User.from_json(user_data)
+    other_user = User(**user_data)
+    for name in User.__slots__:
+        assert getattr(user, name) == getattr(other_user, name)
+    assert user.default_group is None
+    assert user.additional_info is User(**user_data).additional_info
+    user = User.from_json({**user_data, "defaultVisibility": "public"})
+    assert user.additional_info == {"defaultVisibility": "public"}
+    assert user.defaultVisibility == "public"
+    assert getattr(user, "defaultGroup", None) is None
+    with pytest.raises(AttributeError):
+        user.defaultGroup
+
+
+_HASH = {"sha1": "abc", "md5": "def", "sha256": "ghi", "size": 42}
+_FINDINGS = {"scanner": ["MIT"], "conclusion": ["MIT"], "copyright": ["(c) me"]}
+_UPLOAD = {
+    "folderId": 1,
+    "folderName": "Software Repository",
+    "id": 2,
+    "description": "",
+    "uploadName": "a.tar.xz",
+    "uploadDate": "2023-08-07 10:00:00",
+    "assignee": "fossy",
+    "closingDate": "2023-08-08 10:00:00",
+    "hash": _HASH,
+    "newField": 1,
+}
+_AGENTS = {
+    "bucket": True,
+    "copyright_email_author": True,
+    "ecc": False,
+    "keyword": False,
+    "mimetype": True,
+    "monk": True,
+    "nomos": True,
+    "ojo": False,
+    "package": True,
+    "reso": True,
+}
+_SERVER = {
+    "version": "4.3.0",
+    "branchName": "master",
+    "commitHash": "abc",
+    "commitDate": "2023-08-07",
+    "buildDate": "2023-08-08",
+}
+
+# One payload per model at least, with an unknown field where **kwargs takes it
+MODEL_PAYLOADS = [
+    (Agents, _AGENTS),
+    (
+        User,
+        {
+            "id": 2,
+            "name": "fossy",
+            "description": "super user",
+            "accessLevel": "admin",
+            "rootFolderId": 1,
+            "agents": _AGENTS,
+            "newField": 1,
+        },
+    ),
+    (
+        UserGroupMember,
+        {"user": {"id": 2, "name": "fossy", "description": ""}, "group_perm": 1},
+    ),
+    (
+        Folder,
+        {
+            "id": 1,
+            "name": "Software Repository",
+            "description": "",
+            "parent": None,
+            "newField": 1,
+        },
+    ),
+    (Findings, {**_FINDINGS, "newField": 1}),
+    (Group, {"id": 1, "name": "fossy", "newField": 1}),
+    (PermGroups, {"perm": "1", "group_pk": "2", "group_name": "fossy"}),
+    (
+        UploadPermGroups,
+        {
+            "publicPerm": "0",
+            "permGroups": [{"perm": "1", "group_pk": "2", "group_name": "fossy"}],
+            "newField": 1,
+        },
+    ),
+    (
+        License,
+        {
+            "shortName": "MIT",
+            "fullName": "MIT License",
+            "text": "",
+            "url": "",
+            "risk": 1,
+            "isCandidate": False,
+            "id": 3,
+            "newField": 1,
+        },
+    ),
+    (
+        Obligation,
+        {
+            "id": 1,
+            "topic": "topic",
+            "type": "Obligation",
+            "text": "",
+            "classification": "green",
+            "comment": "",
+            "newField": 1,
+        },
+    ),
+    (Hash, {**_HASH, "newField": 1}),
+    (File, {"hash": _HASH, "findings": _FINDINGS, "uploads": [1]}),
+    (
+        FileInfo,
+        {
+            "viewInfo": {"view": 1},
+            "metaInfo": {"meta": 2},
+            "packageInfo": {"package": 3},
+            "tagInfo": {"tag": 4},
+            "reuseInfo": {"reuse": 5},
+            "newField": 1,
+        },
+    ),
+    (Upload, _UPLOAD),
+    (
+        Upload,
+        {
+            "folderId": 1,
+            "folderName": "Software Repository",
+            "id": 2,
+            "description": "",
+            "uploadName": "a.tar.xz",
+            "uploadDate": "2023-08-07 10:00:00",
+            "filesize": 42,
+            "filesha1": "abc",
+        },
+    ),
+    (UploadCopyrights, {"copyright": "(c) me", "filePath": ["a", "b"], "newField": 1}),
+    (UploadLicenses, {"filePath": "a", "findings": _FINDINGS, "newField": 1}),
+    (
+        Summary,
+        {
+            "id": 1,
+            "uploadName": "a.tar.xz",
+            "mainLicense": "MIT",
+            "uniqueLicenses": 1,
+            "totalLicenses": 2,
+            "uniqueConcludedLicenses": 0,
+            "totalConcludedLicenses": 0,
+            "filesToBeCleared": 2,
+            "filesCleared": 0,
+            "clearingStatus": "Open",
+            "copyrightCount": 3,
+            "newField": 1,
+        },
+    ),
+    (
+        Job,
+        {
+            "id": 1,
+            "name": "job",
+            "queueDate": "2023-08-07 10:00:00",
+            "uploadId": 2,
+            "userId": 3,
+            "groupId": 3,
+            "eta": 0,
+            "status": "Completed",
+            "newField": 1,
+        },
+    ),
+    (ApiLicense, {"name": "GPL-2.0-only", "url": ""}),
+    (FossologyServer, _SERVER),
+    (
+        ApiInfo,
+        {
+            "name": "FOSSology API",
+            "description": "",
+            "version": "1.5.1",
+            "security": [],
+            "contact": "",
+            "license": {"name": "GPL-2.0-only", "url": ""},
+            "fossology": _SERVER,
+            "newField": 1,
+        },
+    ),
+    (Status, {"status": "OK"}),
+    (
+        HealthInfo,
+        {"status": "OK", "scheduler": {"status": "OK"}, "db": {"status": "OK"}},
+    ),
+    (
+        SearchResult,
+        {"upload": _UPLOAD, "uploadTreeId": 1, "filename": "a", "newField": 1},
+    ),
+    (
+        GetClearingHistory,
+        {
+            "date": "2023-08-07",
+            "username": "fossy",
+            "scope": "local",
+            "type": "IDENTIFIED",
+            "addedLicenses": ["MIT"],
+            "removedLicenses": [],
+            "newField": 1,
+        },
+    ),
+    (
+        GetBulkHistory,
+        {
+            "bulkId": 1,
+            "clearingEventId": 2,
+            "text": "",
+            "matched": True,
+            "tried": False,
+            "addedLicenses": ["MIT"],
+            "removedLicenses": [],
+            "newField": 1,
+        },
+    ),
+    (GetPrevNextItem, {"prevItemId": 1, "nextItemId": 2, "newField": 1}),
+]
+
+
+def _state(value):
+    # Slots of the models, nested objects included, in a comparable form
+    if isinstance(value, list):
+        return [_state(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _state(item) for key, item in value.items()}
+    if not isinstance(value, _JsonModel):
+        return value
+    for name in type(value).__match_args__:
+        # Create the nested objects which are kept as JSON until first read
+        getattr(value, name)
+    return type(value), {
+        name: _state(getattr(value, name))
+        for cls in type(value).__mro__
+        for name in getattr(cls, "__slots__", ())
+        if hasattr(value, name)
+    }
+
+
+def _models(cls=_JsonModel):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _models(subclass)
+
+
+def test_model_payloads_cover_all_models():
+    assert {cls for cls, _ in MODEL_PAYLOADS} == set(_models())
+
+
+@pytest.mark.parametrize(
+    "cls, payload", MODEL_PAYLOADS, ids=[cls.__name__ for cls, _ in MODEL_PAYLOADS]
+)
+def test_from_json_matches_constructor_for_all_models(cls, payload):
+    arguments = {key: name for name, key in getattr(cls, "_json_keys", {}).items()}
+    from_json = cls.from_json(copy.deepcopy(payload))
+    constructed = cls(
+        **{
+            arguments.get(key, key): value
+            for key, value in copy.deepcopy(payload).items()
+        }
+    )
+    assert _state(from_json) == _state(constructed)
+
+
+def test_user_agents_are_parsed_on_first_access():
+    agents_data = Agents(
+        True, True, False, False, True, True, True, False, True
+    ).to_dict()
+    user = User.from_json(
+        {"id": 2, "name": "fossy", "description": "", "agents": agents_data}
+    )
+    assert user._agents_raw is agents_data
+    assert isinstance(user.agents, Agents)
+    assert user.agents is user.agents
+    assert (
+        User.from_json(
+            {"id": 2, "name": "fossy", "description": "", "agents": {}}
+        ).agents
+        is None
+    )
+
+
+def test_agents_to_json_is_compact():
+    agents = Agents(True, True, False, False, True, True, True, False, True)
+    assert agents.to_json().startswith('{"bucket":true,"copyright_email_author":true,')
+    assert json.loads(agents.to_json()) == agents.to_dict()
+
+
+def test_upload_batch_stores_columns():
+    uploads_data = [
+        {
+            "folderId": 1,
+            "folderName": "Software Repository",
+            "id": upload_id,
+            "description": "",
+            "uploadName": f"upload-{upload_id}.tar.xz",
+            "uploadDate": "2023-08-07 10:00:00",
+            "hash": {"sha1": "abc", "md5": "def", "sha256": "ghi", "size": size},
+        }
+        for upload_id, size in ((2, 42), (3, 1024))
+    ]
+    batch = UploadBatch.from_json_list(uploads_data)
+    assert len(batch) == 2
+    assert list(batch.ids) == [2, 3]
+    assert max(batch.filesizes) == 1024
+    assert batch.uploadnames == ["upload-2.tar.xz", "upload-3.tar.xz"]
+    uploads = list(batch)
+    assert uploads[1].uploadname == "upload-3.tar.xz"
+    assert uploads[1].hash.size == 1024
+    assert "folderId" in uploads_data[0]
+
+
+def test_upload_batch_keeps_all_upload_fields():
+    uploads_data = [
+        {
+            "folderId": 1,
+            "folderName": "Software Repository",
+            "id": 2,
+            "description": "",
+            "uploadName": "a.tar.xz",
+            "uploadDate": "2023-08-07 10:00:00",
+            "assignee": "fossy",
+            "closingDate": "2023-08-08 10:00:00",
+            "hash": {"sha1": "abc", "md5": None, "sha256": None, "size": None},
+            "newField": 1,
+        },
+        {
+            "folderName": "Software Repository",
+            "id": 3,
+            "description": "",
+            "uploadName": "b.tar.xz",
+            "uploadDate": "2023-08-07 10:00:00",
+        },
+    ]
+    batch = UploadBatch.from_json_list(uploads_data)
+    assert list(batch.folderids) == [1, -1]
+    assert list(batch.filesizes) == [-1, -1]
+    upload = next(iter(batch))
+    assert upload.assignee == "fossy"
+    assert upload.closeDate == "2023-08-08 10:00:00"
+    assert upload.newField == 1
+    assert upload.additional_info == Upload.from_json(uploads_data[0]).additional_info
+
+
+def test_agents_to_json_keeps_non_ascii_characters():
+    agents = Agents(True, True, False, False, True, True, True, False, True, üd=True)
+    assert agents.to_json().endswith(',"üd":true}')
+
+
+def test_nested_objects_are_created_on_first_access():
+    health = HealthInfo.from_json(
+        {"status": "OK", "scheduler": {"status": "OK"}, "db": {"status": "OK"}}
+    )
+    assert health._db_raw == {"status": "OK"}
+    assert health.db.status == "OK"
+    assert health.db is health.db
+    upload = Upload(1, "Software Repository", 2, "", "upload.tar.xz", "2023-08-07")
+    assert upload.hash is None
+    upload.hash = {"sha1": "abc", "md5": "def", "sha256": "ghi", "size": 42}
+    assert isinstance(upload.hash, Hash)
+
+
+def test_nested_objects_can_be_passed_as_objects():
+    upload_hash = Hash("abc", "def", "ghi", 42)
+    upload = Upload(1, "Software Repository", 2, "", "upload.tar.xz", "2023-08-07")
+    upload.hash = upload_hash
+    assert upload.hash is upload_hash
+    search_result = SearchResult(upload, 3, "README.md")
+    assert search_result.upload is upload
+
+
+def test_findings_str_without_copyrights():
+    findings = Findings(["MIT"])
+    assert str(findings).endswith("0 copyrights")
+    file_licenses = UploadLicenses("README.md", {"scanner": ["MIT"]})
+    assert str(file_licenses) == "File README.md has 0 license and 0matches"
+
+
+def test_match_args_follow_the_constructor():
+    job = Job(1, "job", "2023-08-07 10:00:00", 2, 3, 3, 0, "Completed")
+    match job:
+        case Job(id, name):
+            assert (id, name) == (1, "job")
+
+
+def test_upload_hash_from_file_size_and_sha1():
+    upload = Upload.from_json(
+        {
+            "folderid": 1,
+            "foldername": "Software Repository",
+            "id": 2,
+            "description": "",
+            "uploadname": "base-files_11.tar.xz",
+            "uploaddate": "2023-08-07 10:00:00",
+            "filesize": 42,
+            "filesha1": "abc",
+        }
+    )
+    assert upload.hash.size == upload.filesize == 42
+    assert upload.hash.sha1 == upload.filesha1 == "abc"
+    assert not upload.additional_info
+    upload.hash = None
+    assert upload.filesize is None
+    assert str(upload).startswith("Upload 'base-files_11.tar.xz' (2, NoneB, None)")
+
+
+def test_upload_from_json_camel_case_fallbacks():
+    upload_data = {
+        "folderId": 1,
+        "folderName": "Software Repository",
+        "id": 2,
+        "description": "",
+        "uploadName": "base-files_11.tar.xz",
+        "uploadDate": "2023-08-07 10:00:00",
+        "filesize": 42,
+        "filesha1": "abc",
+    }
+    upload = Upload.from_json(upload_data)
+    assert upload.folderid == 1
+    assert upload.uploadname == "base-files_11.tar.xz"
+    assert upload.hash.size == upload.filesize == 42
+    assert upload.hash.sha1 == "abc"
+    assert not upload.additional_info
+    del upload_data["description"]
+    with pytest.raises(TypeError, match="description"):
+        Upload.from_json(upload_data)
+
+
+def test_repr_shows_the_identifying_field():
+    assert repr(Folder(1, "Software Repository", "", None)) == "Folder(id=1)"
+    assert repr(Hash("abc", "def", "ghi", 42)) == "Hash(sha1='abc')"
+    assert repr(Findings(["MIT"])) == "Findings()"
+
+
+def test_uploads_with_the_same_content_have_their_own_hash():
+    file_hash = {"sha1": "abc", "md5": "def", "sha256": "ghi", "size": 42}
+    upload = Upload(1, "Software Repository", 2, "", "a.tar.xz", "", hash=file_hash)
+    other_upload = Upload(
+        1, "Software Repository", 3, "", "b.tar.xz", "", hash=dict(file_hash)
+    )
+    upload.hash.size = 99
+    assert other_upload.hash.size == 42
+    assert pickle.loads(pickle.dumps(upload.hash)).sha1 == "abc"
+
+
+def test_enum_fields_are_looked_up_by_value():
+    group_data = {"perm": "10", "group_pk": "3", "group_name": "fossy"}
+    assert PermGroups.from_json(group_data).perm is Permission.ADMIN
+    with pytest.raises(ValueError):
+        PermGroups.from_json({**group_data, "perm": "42"})
@@ -1,6 +1,7 @@
 # Copyright 2019 Siemens AG
 # SPDX-License-Identifier: MIT
 
+import io
 import mimetypes
 import os
 import secrets
@@ -113,3 +114,20 @@ def test_download_report_filename_with_single_quotes(foss_server: str, foss: Fos
     )
     _, report_name = foss.download_report(report_id)
     assert report_name == "Report_FileName.docx"
+
+
+@responses.activate
+def test_download_report_to_sink(foss_server: str, foss: Fossology):
+    report_id = "1"
+    responses.add(
+        responses.GET,
+        f"{foss_server}/api/v1/report/{report_id}",
+        status=200,
+        body=b"report content",
+        headers={"Content-Disposition": "attachment; filename=Report_FileName.docx"},
+    )
+    sink = io.BytesIO()
+    report, report_name = foss.download_report(report_id, sink=sink)
+    assert report is None
+    assert report_name == "Report_FileName.docx"
+    assert sink.getvalue() == b"report content"
@@ -1,7 +1,10 @@
 # Copyright 2019 Siemens AG
 # SPDX-License-Identifier: MIT
 
+import json
 import secrets
+import time
+from functools import partial
 
 import pytest
 import responses
@@ -80,6 +83,52 @@ def test_search_error(foss_server: str, foss: Fossology):
     assert "Unable to get a result with the given search criteria" in str(excinfo.value)
 
 
+def search_page_callback(request, failing_page=None):
+    page = int(request.headers["page"])
+    if page == failing_page:
+        return 500, {}, "{}"
+    # Later pages answer first, the results must still come back in page order
+    time.sleep((5 - page) * 0.01)
+    result = {
+        "upload": {
+            "folderId": 1,
+            "folderName": "Software Repository",
+            "id": 1,
+            "description": "",
+            "uploadName": "base-files_11.tar.xz",
+            "uploadDate": "2023-08-07 10:00:00",
+        },
+        "uploadTreeId": page,
+        "filename": f"file-{page}",
+    }
+    return 200, {"X-TOTAL-PAGES": "5"}, json.dumps([result])
+
+
+@responses.activate
+def test_search_all_pages(foss_server: str, foss: Fossology):
+    responses.add_callback(
+        responses.GET, f"{foss_server}/api/v1/search", callback=search_page_callback
+    )
+    search_result, total_pages = foss.search(all_pages=True)
+    assert total_pages == 5
+    assert [result.filename for result in search_result] == [
+        f"file-{page}" for page in range(1, 6)
+    ]
+    assert len(responses.calls) == 5
+
+
+@responses.activate
+def test_search_all_pages_error(foss_server: str, foss: Fossology):
+    responses.add_callback(
+        responses.GET,
+        f"{foss_server}/api/v1/search",
+        callback=partial(search_page_callback, failing_page=3),
+    )
+    with pytest.raises(FossologyApiError) as excinfo:
+        foss.search(all_pages=True)
+    assert "Unable to get a result with the given search criteria" in str(excinfo.value)
+
+
 def test_filesearch(foss: Fossology, upload: Upload):
     filelist = [
         {"md5": "F921793D03CC6D63EC4B15E9BE8FD3F8"},
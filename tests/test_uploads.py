@@ -7,13 +7,20 @@ import secrets
 import time
 from datetime import date, timedelta
 from pathlib import Path
+from unittest import mock
 
 import pytest
 import responses
+from requests_toolbelt import MultipartEncoder
+from requests_toolbelt.multipart.decoder import MultipartDecoder
 
 from fossology import Fossology
 from fossology.enums import AccessLevel, ClearingStatus
-from fossology.exceptions import AuthorizationError, FossologyApiError
+from fossology.exceptions import (
+    AuthorizationError,
+    FossologyApiError,
+    FossologyBulkError,
+)
 from fossology.obj import Folder, Upload
 
 
@@ -196,6 +203,65 @@ def test_upload_error(foss: Fossology, foss_server: str, test_file_path: str):
     assert f"Upload {description} could not be performed" in str(excinfo.value)
 
 
+@responses.activate
+def test_upload_file_streams_multipart_body(
+    foss: Fossology, foss_server: str, tmp_path: Path
+):
+    test_file = tmp_path / "upload.tar.xz"
+    test_file.write_bytes(b"upload content")
+    responses.add(
+        responses.POST,
+        f"{foss_server}/api/v1/uploads",
+        status=201,
+        json={"message": 10},
+    )
+    responses.add(
+        responses.GET,
+        f"{foss_server}/api/v1/uploads/10",
+        status=200,
+        json={
+            "folderId": foss.rootFolder.id,
+            "folderName": foss.rootFolder.name,
+            "id": 10,
+            "description": "Streamed upload",
+            "uploadName": "upload.tar.xz",
+            "uploadDate": "2023-08-07 10:00:00",
+            "hash": {"sha1": None, "md5": None, "sha256": None, "size": 14},
+        },
+    )
+    with mock.patch(
+        "fossology.uploads.MultipartEncoder", wraps=MultipartEncoder
+    ) as encoder:
+        upload = foss.upload_file(
+            foss.rootFolder,
+            file=str(test_file),
+            description="Streamed upload",
+            access_level=AccessLevel.PUBLIC,
+        )
+    encoder.assert_called_once()
+    assert upload.id == 10
+    request = responses.calls[0].request
+    body = request.body
+    if isinstance(body, MultipartEncoder):
+        # Older versions of responses keep the stream instead of reading it
+        body = body.to_string()
+    parts = {}
+    for part in MultipartDecoder(body, request.headers["Content-Type"]).parts:
+        disposition = part.headers[b"Content-Disposition"].decode()
+        name = disposition.split('name="')[1].split('"')[0]
+        parts[name] = (disposition, part.content)
+    assert {name: content for name, (_, content) in parts.items()} == {
+        "folderId": str(foss.rootFolder.id).encode(),
+        "uploadDescription": b"Streamed upload",
+        "public": b"public",
+        "applyGlobal": b"False",
+        "ignoreScm": b"False",
+        "uploadType": b"file",
+        "fileInput": b"upload content",
+    }
+    assert 'filename="upload.tar.xz"' in parts["fileInput"][0]
+
+
 def test_move_upload(foss: Fossology, upload: Upload, move_folder: Folder):
     foss.move_upload(upload, move_folder, "move")
     moved_upload = foss.detail_upload(upload.id)
@@ -230,6 +296,80 @@ def test_move_upload_error(foss: Fossology, foss_server: str, upload: Upload):
         foss.move_upload(upload, folder, "move")
 
 
+@responses.activate
+def test_move_uploads_error(foss: Fossology, foss_server: str, upload: Upload):
+    folder = Folder(secrets.randbelow(1000), "Folder", "", foss.rootFolder)
+    responses.add(
+        responses.PUT,
+        f"{foss_server}/api/v1/uploads/{upload.id}",
+        status=500,
+    )
+    with pytest.raises(FossologyBulkError) as excinfo:
+        foss.move_uploads([upload], folder, "move")
+    assert [failed for failed, _ in excinfo.value.failures] == [upload]
+    assert f"Unable to move 1 of 1 uploads: upload {upload.id}:" in str(excinfo.value)
+
+
+@responses.activate
+def test_move_uploads(foss: Fossology, foss_server: str):
+    folder = Folder(secrets.randbelow(1000), "Folder", "", foss.rootFolder)
+    uploads = [
+        Upload(1, "Software Repository", upload_id, "", "upload.tar.xz", "")
+        for upload_id in (10, 11, 12)
+    ]
+    for upload in uploads:
+        responses.add(
+            responses.PUT,
+            f"{foss_server}/api/v1/uploads/{upload.id}",
+            status=202,
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"folderId": str(folder.id), "action": "copy"}
+                )
+            ],
+        )
+    foss.move_uploads(uploads, folder, "copy")
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_delete_uploads(foss: Fossology, foss_server: str):
+    uploads = [
+        Upload(1, "Software Repository", upload_id, "", "upload.tar.xz", "")
+        for upload_id in (10, 11, 12)
+    ]
+    for upload in uploads:
+        responses.add(
+            responses.DELETE,
+            f"{foss_server}/api/v1/uploads/{upload.id}",
+            status=202,
+        )
+    foss.delete_uploads(uploads)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_delete_uploads_reports_all_failures(foss: Fossology, foss_server: str):
+    uploads = [
+        Upload(1, "Software Repository", upload_id, "", "upload.tar.xz", "")
+        for upload_id in (10, 11, 12)
+    ]
+    for upload, status in zip(uploads, (500, 202, 403)):
+        responses.add(
+            responses.DELETE,
+            f"{foss_server}/api/v1/uploads/{upload.id}",
+            status=status,
+        )
+    with pytest.raises(FossologyBulkError) as excinfo:
+        foss.delete_uploads(uploads)
+    assert len(responses.calls) == 3
+    failures = excinfo.value.failures
+    assert [upload.id for upload, _ in failures] == [10, 12]
+    assert isinstance(failures[0][1], FossologyApiError)
+    assert isinstance(failures[1][1], AuthorizationError)
+    assert str(excinfo.value).startswith("Unable to delete 2 of 3 uploads: upload 10:")
+
+
 def test_update_upload(foss: Fossology, upload: Upload):
     foss.update_upload(upload, ClearingStatus.INPROGRESS, "I am taking over", foss.user)
     summary = foss.upload_summary(upload)